@@ -20,7 +20,7 @@ type GoCoaxConfigEntry = ConfigEntry[GoCoaxCoordinator]
 async def async_setup_entry(hass: HomeAssistant, entry: GoCoaxConfigEntry) -> bool:
     """Set up goCoax MoCA from a config entry."""
     host = entry.data[CONF_HOST]
-    LOG.debug(f"Setting up goCoax integration for {host}")
+    LOG.debug("Setting up goCoax integration for %s", host)
 
     # create coordinator
     coordinator = GoCoaxCoordinator(hass, entry)
@@ -37,20 +37,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: GoCoaxConfigEntry) -> bo
     # forward to platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    LOG.info(f"goCoax integration setup complete for {host}")
+    LOG.info("goCoax integration setup complete for %s", host)
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: GoCoaxConfigEntry) -> bool:
     """Unload a goCoax config entry."""
     host = entry.data[CONF_HOST]
-    LOG.debug(f"Unloading goCoax integration for {host}")
+    LOG.debug("Unloading goCoax integration for %s", host)
 
     # unload platforms
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        LOG.info(f"goCoax integration unloaded for {host}")
+        LOG.info("goCoax integration unloaded for %s", host)
 
     return unload_ok
 
@@ -59,5 +59,5 @@ async def async_options_update_listener(
     hass: HomeAssistant, entry: GoCoaxConfigEntry
 ) -> None:
     """Handle options update."""
-    LOG.debug(f"Options updated for goCoax {entry.data[CONF_HOST]}, reloading")
+    LOG.debug("Options updated for goCoax %s, reloading", entry.data[CONF_HOST])
     await hass.config_entries.async_reload(entry.entry_id)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 from collections.abc import Callable
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Any
 
 from homeassistant.components.binary_sensor import (
@@ -14,12 +15,10 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import GoCoaxConfigEntry
-from .const import DOMAIN, MANUFACTURER_GOCOAX
 from .coordinator import GoCoaxCoordinator
 from .pygocoax import AdapterStatus
 
@@ -39,21 +38,21 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[GoCoaxBinarySensorEntityDescription, ...] = (
         key="link_status",
         translation_key="link_status",
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
-        value_fn=lambda data: data.link_status,
+        value_fn=attrgetter("link_status"),
     ),
     GoCoaxBinarySensorEntityDescription(
         key="network_controller",
         translation_key="network_controller",
         icon="mdi:crown",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.network_controller,
+        value_fn=attrgetter("network_controller"),
     ),
     GoCoaxBinarySensorEntityDescription(
         key="encryption_enabled",
         translation_key="encryption_enabled",
         icon="mdi:lock",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.encryption_enabled,
+        value_fn=attrgetter("encryption_enabled"),
     ),
 )
 
@@ -66,12 +65,10 @@ async def async_setup_entry(
     """Set up goCoax binary sensor entities."""
     coordinator = entry.runtime_data
 
-    entities: list[GoCoaxBinarySensor] = [
+    async_add_entities(
         GoCoaxBinarySensor(coordinator, description)
         for description in BINARY_SENSOR_DESCRIPTIONS
-    ]
-
-    async_add_entities(entities)
+    )
 
 
 class GoCoaxBinarySensor(CoordinatorEntity[GoCoaxCoordinator], BinarySensorEntity):
@@ -89,33 +86,20 @@ class GoCoaxBinarySensor(CoordinatorEntity[GoCoaxCoordinator], BinarySensorEntit
         super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.mac_address}_{description.key}"
-        self._attr_device_info = self._build_device_info()
-
-    def _build_device_info(self) -> DeviceInfo:
-        """Build device info for this sensor."""
-        data = self.coordinator.data
-        return DeviceInfo(
-            identifiers={
-                (DOMAIN, self.coordinator.mac_address or self.coordinator.host)
-            },
-            connections={(CONNECTION_NETWORK_MAC, data.mac_address)} if data else set(),
-            name=f"goCoax {self.coordinator.host}",
-            manufacturer=MANUFACTURER_GOCOAX,
-            model=data.model if data else None,
-            sw_version=data.firmware_version if data else None,
-            configuration_url=f"http://{self.coordinator.host}",
-        )
+        self._attr_device_info = coordinator.device_info
 
     @property
     def is_on(self) -> bool | None:
         """Return the sensor state."""
-        if not self.coordinator.data:
+        if (data := self.coordinator.data) is None:
             return None
-        return self.entity_description.value_fn(self.coordinator.data)
+        return self.entity_description.value_fn(data)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return extra state attributes."""
-        if not self.coordinator.data or not self.entity_description.extra_attrs_fn:
+        data = self.coordinator.data
+        extra_attrs_fn = self.entity_description.extra_attrs_fn
+        if data is None or extra_attrs_fn is None:
             return None
-        return self.entity_description.extra_attrs_fn(self.coordinator.data)
+        return extra_attrs_fn(data)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -32,12 +33,59 @@ from .const import (
     DOMAIN,
     MAX_SCAN_INTERVAL,
     MIN_SCAN_INTERVAL,
+    MODELS,
 )
 from .pygocoax import GoCoaxClient
-from .pygocoax.exceptions import GoCoaxAuthError, GoCoaxConnectionError
+from .pygocoax.exceptions import (
+    GoCoaxAuthError,
+    GoCoaxConnectionError,
+    GoCoaxTimeoutError,
+)
 
 LOG = logging.getLogger(__name__)
 
+# selectors and schemas are immutable, so build them once at import time
+_TEXT_SELECTOR = TextSelector(TextSelectorConfig(type=TextSelectorType.TEXT))
+_PASSWORD_SELECTOR = TextSelector(TextSelectorConfig(type=TextSelectorType.PASSWORD))
+_SCAN_INTERVAL_SELECTOR = NumberSelector(
+    NumberSelectorConfig(
+        min=MIN_SCAN_INTERVAL,
+        max=MAX_SCAN_INTERVAL,
+        step=5,
+        unit_of_measurement="seconds",
+        mode=NumberSelectorMode.SLIDER,
+    )
+)
+
+USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_HOST): _TEXT_SELECTOR,
+        vol.Optional(CONF_USERNAME, default=DEFAULT_USERNAME): _TEXT_SELECTOR,
+        vol.Optional(CONF_PASSWORD, default=DEFAULT_PASSWORD): _PASSWORD_SELECTOR,
+    }
+)
+
+
+def _make_reauth_schema(username: str | None) -> vol.Schema:
+    """Build the reauth schema with the current username as default."""
+    return vol.Schema(
+        {
+            vol.Optional(CONF_USERNAME, default=username): _TEXT_SELECTOR,
+            vol.Required(CONF_PASSWORD): _PASSWORD_SELECTOR,
+        }
+    )
+
+
+def _make_options_schema(scan_interval: int) -> vol.Schema:
+    """Build the options schema with the current option values as defaults."""
+    return vol.Schema(
+        {
+            vol.Optional(
+                CONF_SCAN_INTERVAL, default=scan_interval
+            ): _SCAN_INTERVAL_SELECTOR,
+        }
+    )
+
 
 class GoCoaxConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for goCoax MoCA."""
@@ -88,19 +136,7 @@ class GoCoaxConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_HOST): TextSelector(
-                        TextSelectorConfig(type=TextSelectorType.TEXT)
-                    ),
-                    vol.Optional(CONF_USERNAME, default=DEFAULT_USERNAME): TextSelector(
-                        TextSelectorConfig(type=TextSelectorType.TEXT)
-                    ),
-                    vol.Optional(CONF_PASSWORD, default=DEFAULT_PASSWORD): TextSelector(
-                        TextSelectorConfig(type=TextSelectorType.PASSWORD)
-                    ),
-                }
-            ),
+            data_schema=USER_SCHEMA,
             errors=errors,
         )
 
@@ -142,16 +178,7 @@ class GoCoaxConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="reauth_confirm",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(CONF_USERNAME, default=self._username): TextSelector(
-                        TextSelectorConfig(type=TextSelectorType.TEXT)
-                    ),
-                    vol.Required(CONF_PASSWORD): TextSelector(
-                        TextSelectorConfig(type=TextSelectorType.PASSWORD)
-                    ),
-                }
-            ),
+            data_schema=_make_reauth_schema(self._username),
             errors=errors,
             description_placeholders={"host": self._host},
         )
@@ -166,18 +193,36 @@ class GoCoaxConfigFlow(ConfigFlow, domain=DOMAIN):
             session=session,
         )
 
-        try:
-            self._mac_address = await client.get_mac_address()
-            if not self._mac_address:
-                return "cannot_connect"
-            return None
-        except GoCoaxAuthError:
+        # mac and device info are independent endpoints; the client allows
+        # several requests in flight, so both fetches overlap
+        results = await asyncio.gather(
+            client.get_mac_address(),
+            client.get_device_info(),
+            return_exceptions=True,
+        )
+
+        # surface auth failures first so the user is prompted for credentials
+        if any(isinstance(result, GoCoaxAuthError) for result in results):
             return "invalid_auth"
-        except GoCoaxConnectionError:
+        for result in results:
+            if isinstance(result, GoCoaxConnectionError | GoCoaxTimeoutError):
+                return "cannot_connect"
+            if isinstance(result, Exception):
+                LOG.error(
+                    "Unexpected error during connection validation", exc_info=result
+                )
+                return "unknown"
+
+        mac_address, device_info = results
+        if not mac_address:
             return "cannot_connect"
-        except Exception:
-            LOG.exception("Unexpected error during connection validation")
-            return "unknown"
+
+        self._mac_address = mac_address
+        # the model is only used to flag adapters this integration does not know
+        model = device_info.get("model")
+        if model and model not in MODELS:
+            LOG.warning("Unrecognized goCoax model %s at %s", model, self._host)
+        return None
 
 
 class GoCoaxOptionsFlow(OptionsFlow):
@@ -200,19 +245,5 @@ class GoCoaxOptionsFlow(OptionsFlow):
 
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(
-                        CONF_SCAN_INTERVAL, default=current_interval
-                    ): NumberSelector(
-                        NumberSelectorConfig(
-                            min=MIN_SCAN_INTERVAL,
-                            max=MAX_SCAN_INTERVAL,
-                            step=5,
-                            unit_of_measurement="seconds",
-                            mode=NumberSelectorMode.SLIDER,
-                        )
-                    ),
-                }
-            ),
+            data_schema=_make_options_schema(current_interval),
         )
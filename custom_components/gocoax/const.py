@@ -1,5 +1,7 @@
 """Constants for the goCoax MoCA integration."""
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Final
 
 DOMAIN: Final = "gocoax"
@@ -17,47 +19,50 @@ DEFAULT_SCAN_INTERVAL: Final = 30  # seconds
 DEFAULT_TIMEOUT: Final = 15  # seconds
 MIN_SCAN_INTERVAL: Final = 10
 MAX_SCAN_INTERVAL: Final = 300
+MAX_BACKOFF_INTERVAL: Final = 600  # seconds, cap for polling after failures
 
 # manufacturers
 MANUFACTURER_GOCOAX: Final = "goCoax"
 MANUFACTURER_FRONTIER: Final = "Frontier"
 
-# known models
-MODELS: Final = {
-    "MA2500D": {
-        "manufacturer": MANUFACTURER_GOCOAX,
-        "moca": "2.5",
-        "ethernet": "2.5 GbE",
-    },
-    "MA2500C": {
-        "manufacturer": MANUFACTURER_GOCOAX,
-        "moca": "2.5",
-        "ethernet": "2.5 GbE",
-    },
-    "WF-803M": {
-        "manufacturer": MANUFACTURER_GOCOAX,
-        "moca": "2.5",
-        "ethernet": "1.0 GbE",
-    },
-    "FCA252": {
-        "manufacturer": MANUFACTURER_FRONTIER,
-        "moca": "2.5",
-        "ethernet": "1.0 GbE",
-    },
-    "WF-803T": {
-        "manufacturer": MANUFACTURER_FRONTIER,
-        "moca": "2.5",
-        "ethernet": "1.0 GbE",
-    },
-    "FCA251": {
-        "manufacturer": MANUFACTURER_FRONTIER,
-        "moca": "2.5",
-        "ethernet": "1.0 GbE",
-    },
-}
+# known models (read-only)
+MODELS: Final[Mapping[str, Mapping[str, str]]] = MappingProxyType(
+    {
+        "MA2500D": {
+            "manufacturer": MANUFACTURER_GOCOAX,
+            "moca": "2.5",
+            "ethernet": "2.5 GbE",
+        },
+        "MA2500C": {
+            "manufacturer": MANUFACTURER_GOCOAX,
+            "moca": "2.5",
+            "ethernet": "2.5 GbE",
+        },
+        "WF-803M": {
+            "manufacturer": MANUFACTURER_GOCOAX,
+            "moca": "2.5",
+            "ethernet": "1.0 GbE",
+        },
+        "FCA252": {
+            "manufacturer": MANUFACTURER_FRONTIER,
+            "moca": "2.5",
+            "ethernet": "1.0 GbE",
+        },
+        "WF-803T": {
+            "manufacturer": MANUFACTURER_FRONTIER,
+            "moca": "2.5",
+            "ethernet": "1.0 GbE",
+        },
+        "FCA251": {
+            "manufacturer": MANUFACTURER_FRONTIER,
+            "moca": "2.5",
+            "ethernet": "1.0 GbE",
+        },
+    }
+)
 
 # platforms
-PLATFORMS: Final = ["sensor", "binary_sensor"]
+PLATFORMS: Final = ("sensor", "binary_sensor")
 
 # entity categories
 ATTR_MAC_ADDRESS: Final = "mac_address"
@@ -4,13 +4,14 @@ from __future__ import annotations
 
 import logging
 from datetime import timedelta
-from typing import TYPE_CHECKING
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC, DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
@@ -19,6 +20,8 @@ from .const import (
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_USERNAME,
     DOMAIN,
+    MANUFACTURER_GOCOAX,
+    MAX_BACKOFF_INTERVAL,
 )
 from .pygocoax import AdapterStatus, GoCoaxClient
 from .pygocoax.exceptions import (
@@ -27,9 +30,6 @@ from .pygocoax.exceptions import (
     GoCoaxTimeoutError,
 )
 
-if TYPE_CHECKING:
-    pass
-
 LOG = logging.getLogger(__name__)
 
 
@@ -37,41 +37,56 @@ class GoCoaxCoordinator(DataUpdateCoordinator[AdapterStatus]):
     """Coordinator for goCoax MoCA adapter data."""
 
     config_entry: ConfigEntry
+    device_info: DeviceInfo
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize the coordinator."""
-        self._host = entry.data[CONF_HOST]
+        self.host = entry.data[CONF_HOST]
         self._username = entry.data.get(CONF_USERNAME, DEFAULT_USERNAME)
         self._password = entry.data.get(CONF_PASSWORD, DEFAULT_PASSWORD)
         self._entry = entry
 
         # get scan interval from options or use default
         scan_interval = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        self._scan_interval = timedelta(seconds=scan_interval)
 
         super().__init__(
             hass,
             LOG,
-            name=f"{DOMAIN}_{self._host}",
-            update_interval=timedelta(seconds=scan_interval),
+            name=f"{DOMAIN}_{self.host}",
+            update_interval=self._scan_interval,
             config_entry=entry,
         )
 
         # create client with shared session
         session = async_get_clientsession(hass)
         self._client = GoCoaxClient(
-            host=self._host,
+            host=self.host,
             username=self._username,
             password=self._password,
             session=session,
         )
 
+        self._status_dict: dict[str, Any] | None = None
+        self._status_dict_source: AdapterStatus | None = None
         self._consecutive_errors = 0
         self._max_consecutive_errors = 5
 
     @property
-    def host(self) -> str:
-        """Return the host address."""
-        return self._host
+    def consecutive_errors(self) -> int:
+        """Return the number of consecutive failed updates."""
+        return self._consecutive_errors
+
+    @property
+    def status_dict(self) -> dict[str, Any] | None:
+        """Return the current status as a dict, serialized once per refresh."""
+        if self.data is None:
+            return None
+        # stale data is returned as the same instance, so the cache survives it
+        if self._status_dict_source is not self.data:
+            self._status_dict = self.data.to_dict()
+            self._status_dict_source = self.data
+        return self._status_dict
 
     @property
     def mac_address(self) -> str | None:
@@ -80,57 +95,115 @@ class GoCoaxCoordinator(DataUpdateCoordinator[AdapterStatus]):
             return self.data.mac_address
         return None
 
+    async def _async_setup(self) -> None:
+        """Discover the adapter identity once before the first refresh.
+
+        Entities copy the device info when they are created and Home
+        Assistant registers it only then, so it is built once here; a
+        model or firmware change shows up after the entry is reloaded.
+        """
+        try:
+            # the client keeps the MAC, so later polls skip the lookup
+            mac_address = await self._client.get_mac_address()
+            # status page is cached by the client, so the first poll reuses it
+            device = await self._client.get_device_info()
+        except GoCoaxAuthError as err:
+            raise ConfigEntryAuthFailed(
+                f"Authentication failed for goCoax adapter at {self.host}"
+            ) from err
+        except GoCoaxTimeoutError as err:
+            raise UpdateFailed(f"Timeout connecting to goCoax at {self.host}") from err
+        except GoCoaxConnectionError as err:
+            raise UpdateFailed(f"Cannot connect to goCoax at {self.host}") from err
+
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, mac_address or self.host)},
+            connections=(
+                {(CONNECTION_NETWORK_MAC, mac_address)} if mac_address else set()
+            ),
+            name=f"goCoax {self.host}",
+            manufacturer=MANUFACTURER_GOCOAX,
+            model=device["model"],
+            sw_version=device["firmware_version"],
+            configuration_url=f"http://{self.host}",
+        )
+
+    def _backoff_update_interval(self) -> None:
+        """Stretch the polling interval geometrically after a failed update."""
+        backoff = self._scan_interval.total_seconds() * 2**self._consecutive_errors
+        self.update_interval = timedelta(seconds=min(backoff, MAX_BACKOFF_INTERVAL))
+
+    async def _async_get_status(self) -> AdapterStatus:
+        """Fetch status, retrying once on a transient authentication failure."""
+        try:
+            return await self._client.get_status()
+        except GoCoaxAuthError:
+            # some firmwares briefly return 401 while rotating session state;
+            # retry once before asking the user to reauthenticate
+            LOG.debug("Authentication rejected by goCoax at %s, retrying", self.host)
+            return await self._client.get_status()
+
     async def _async_update_data(self) -> AdapterStatus:
         """Fetch data from goCoax adapter."""
         try:
-            status = await self._client.get_status()
+            status = await self._async_get_status()
             self._consecutive_errors = 0
+            self.update_interval = self._scan_interval
             LOG.debug(
-                f"Updated goCoax data: mac={status.mac_address}, "
-                f"link={status.link_status}, moca={status.moca_version}"
+                "Updated goCoax data: mac=%s, link=%s, moca=%s",
+                status.mac_address,
+                status.link_status,
+                status.moca_version,
             )
             return status
 
         except GoCoaxAuthError as err:
             self._consecutive_errors += 1
-            LOG.error(f"Authentication failed for goCoax at {self._host}")
+            LOG.error("Authentication failed for goCoax at %s", self.host)
             raise ConfigEntryAuthFailed(
-                f"Authentication failed for goCoax adapter at {self._host}"
+                f"Authentication failed for goCoax adapter at {self.host}"
             ) from err
 
         except GoCoaxTimeoutError as err:
             self._consecutive_errors += 1
+            self._backoff_update_interval()
             LOG.warning(
-                f"Timeout communicating with goCoax at {self._host} "
-                f"(error {self._consecutive_errors}/{self._max_consecutive_errors})"
+                "Timeout communicating with goCoax at %s (error %d/%d)",
+                self.host,
+                self._consecutive_errors,
+                self._max_consecutive_errors,
             )
             if self._consecutive_errors >= self._max_consecutive_errors:
                 raise UpdateFailed(
-                    f"Too many consecutive timeouts for goCoax at {self._host}"
+                    f"Too many consecutive timeouts for goCoax at {self.host}"
                 ) from err
             # return stale data if available
             if self.data:
                 return self.data
-            raise UpdateFailed(f"Timeout connecting to goCoax at {self._host}") from err
+            raise UpdateFailed(f"Timeout connecting to goCoax at {self.host}") from err
 
         except GoCoaxConnectionError as err:
             self._consecutive_errors += 1
+            self._backoff_update_interval()
             LOG.warning(
-                f"Connection error to goCoax at {self._host}: {err} "
-                f"(error {self._consecutive_errors}/{self._max_consecutive_errors})"
+                "Connection error to goCoax at %s: %s (error %d/%d)",
+                self.host,
+                err,
+                self._consecutive_errors,
+                self._max_consecutive_errors,
             )
             if self._consecutive_errors >= self._max_consecutive_errors:
                 raise UpdateFailed(
-                    f"Too many consecutive errors for goCoax at {self._host}"
+                    f"Too many consecutive errors for goCoax at {self.host}"
                 ) from err
             # return stale data if available
             if self.data:
                 return self.data
-            raise UpdateFailed(f"Cannot connect to goCoax at {self._host}") from err
+            raise UpdateFailed(f"Cannot connect to goCoax at {self.host}") from err
 
         except Exception as err:
             self._consecutive_errors += 1
-            LOG.exception(f"Unexpected error fetching goCoax data from {self._host}")
+            LOG.exception("Unexpected error fetching goCoax data from %s", self.host)
             raise UpdateFailed(f"Unexpected error: {err}") from err
 
     async def async_shutdown(self) -> None:
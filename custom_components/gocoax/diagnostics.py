@@ -11,13 +11,15 @@ from homeassistant.core import HomeAssistant
 from . import GoCoaxConfigEntry
 
 # keys to redact from diagnostics output
-TO_REDACT = {
-    CONF_PASSWORD,
-    CONF_USERNAME,
-    "mac_address",
-    "source_mac",
-    "target_mac",
-}
+TO_REDACT = frozenset(
+    {
+        CONF_PASSWORD,
+        CONF_USERNAME,
+        "mac_address",
+        "source_mac",
+        "target_mac",
+    }
+)
 
 
 async def async_get_config_entry_diagnostics(
@@ -34,19 +36,20 @@ async def async_get_config_entry_diagnostics(
             "version": entry.version,
             "domain": entry.domain,
             "title": entry.title,
-            "data": async_redact_data(dict(entry.data), TO_REDACT),
-            "options": async_redact_data(dict(entry.options), TO_REDACT),
+            "data": entry.data,
+            "options": entry.options,
         },
         "coordinator": {
             "host": entry.data.get(CONF_HOST),
             "last_update_success": coordinator.last_update_success,
             "update_interval": str(coordinator.update_interval),
+            "consecutive_errors": coordinator.consecutive_errors,
         },
     }
 
     # add adapter data if available
     if coordinator.data:
-        adapter_data = coordinator.data.to_dict()
-        diagnostics_data["adapter"] = async_redact_data(adapter_data, TO_REDACT)
+        diagnostics_data["adapter"] = coordinator.status_dict
 
-    return diagnostics_data
+    # redact the whole payload in a single traversal
+    return async_redact_data(diagnostics_data, TO_REDACT)
@@ -3,12 +3,20 @@
 from __future__ import annotations
 
 import asyncio
+import codecs
+import ipaddress
 import logging
 import re
+import socket
+import time
+from bisect import bisect_right
+from html.parser import HTMLParser
 from typing import TYPE_CHECKING
 
 import aiohttp
-from aiohttp import BasicAuth
+import orjson
+from aiohttp import BasicAuth, hdrs
+from yarl import URL
 
 from .exceptions import (
     GoCoaxAuthError,
@@ -46,11 +54,23 @@ ENDPOINT_PHY_RATES = "/phyRates.html"
 ENDPOINT_SECURITY_HTML = "/security.html"
 ENDPOINT_STATUS_HTML = "/index.html"
 
+# a status poll cannot succeed without these; the rest are best effort
+_REQUIRED_ENDPOINTS = frozenset(
+    {ENDPOINT_MAC, ENDPOINT_LOCAL_INFO, ENDPOINT_FRAME_INFO}
+)
+
 # data indices from decoded format
 LOCAL_INFO_LINK_STATUS_IDX = 5
 LOCAL_INFO_MOCA_VER_IDX = 11
 LOCAL_INFO_NODE_ID_IDX = 3
 LOCAL_INFO_NC_NODE_IDX = 4
+_LOCAL_INFO_INDICES = (
+    LOCAL_INFO_LINK_STATUS_IDX,
+    LOCAL_INFO_MOCA_VER_IDX,
+    LOCAL_INFO_NODE_ID_IDX,
+    LOCAL_INFO_NC_NODE_IDX,
+)
+_LOCAL_INFO_MIN_LEN = max(_LOCAL_INFO_INDICES) + 1
 
 FRAME_TX_GOOD_IDX = 12
 FRAME_TX_BAD_IDX = 30
@@ -59,7 +79,128 @@ FRAME_RX_GOOD_IDX = 66
 FRAME_RX_BAD_IDX = 84
 FRAME_RX_DROP_IDX = 102
 
+# MoCA 2.5 band definitions (approximate): lowest LOF in MHz for each band
+_LOF_BAND_THRESHOLDS = (1000, 1125, 1225, 1400)
+_LOF_BAND_NAMES = ("D-Low", "Extended-D", "D-Mid", "D-High")
+
+# (direction, PacketStats field, index of the counter's high word)
+_FRAME_LAYOUT = (
+    ("tx", "ok", FRAME_TX_GOOD_IDX),
+    ("tx", "bad", FRAME_TX_BAD_IDX),
+    ("tx", "dropped", FRAME_TX_DROP_IDX),
+    ("rx", "ok", FRAME_RX_GOOD_IDX),
+    ("rx", "bad", FRAME_RX_BAD_IDX),
+    ("rx", "dropped", FRAME_RX_DROP_IDX),
+)
+_FRAME_INFO_MIN_LEN = max(idx for _, _, idx in _FRAME_LAYOUT) + 2
+
+# mimetypes decoded as JSON regardless of endpoint
+_JSON_CONTENT_TYPES = frozenset({"application/json", "application/x-json", "text/json"})
+
+# HTML scraping patterns
+_RE_MAC = re.compile(r"([0-9a-fA-F:]{17})")
+_MAC_CHARS = frozenset("0123456789abcdef:")
+_RE_NON_DIGITS = re.compile(r"\D+")
+# plain <tr><td>mac</td><td>tx</td><td>rx</td></tr> rows of the first table
+_RE_FIRST_TABLE = re.compile(r"<table\b.*?</table>", re.IGNORECASE | re.DOTALL)
+_RE_TABLE_ROW = re.compile(r"<tr\b", re.IGNORECASE)
+_RE_PHY_RATE_ROW = re.compile(
+    r"<tr>\s*<td>\s*([0-9a-fA-F:]{17})\s*</td>\s*<td>([^<]*)</td>"
+    r"\s*<td>([^<]*)</td>\s*</tr>",
+    re.IGNORECASE,
+)
+# status page values, each searched for on its own
+_RE_FIRMWARE = re.compile(r"firmware[:\s]+([0-9.]+)", re.IGNORECASE)
+_RE_MODEL = re.compile(r"model[:\s]+(MA\d+\w*|WF-\d+\w*|FCA\d+)", re.IGNORECASE)
+_RE_CHANNELS = re.compile(r"(\d+)\s*channels?", re.IGNORECASE)
+
 DEFAULT_TIMEOUT = 15
+DEFAULT_STATUS_TTL = 5.0
+
+# settings and identity pages rarely change; avoid refetching them every poll
+STATIC_ENDPOINT_TTL = 3600
+
+# keep idle connections open across typical 30-60s polls (aiohttp default is 15s)
+KEEPALIVE_TIMEOUT = 75
+
+
+def _parse_hex(hex_str: str) -> int:
+    """Parse hex string to integer."""
+    if not hex_str:
+        return 0
+    try:
+        return int(hex_str, 16)
+    except (ValueError, TypeError):
+        return 0
+
+
+def _parse_rate(text: str) -> int:
+    """Parse a PHY rate cell such as "2,500 Mbps" to an integer."""
+    return int(_RE_NON_DIGITS.sub("", text) or "0")
+
+
+def _format_moca_version(ver_int: int) -> str:
+    """Format an encoded MoCA version."""
+    # version is encoded as major * 16 + minor
+    if ver_int >= 0x20:
+        major = ver_int >> 4
+        minor = ver_int & 0x0F
+        return f"{major}.{minor}"
+    return "unknown"
+
+
+# the version is a single byte in practice, so precompute all of them
+_MOCA_VERSIONS = tuple(_format_moca_version(ver_int) for ver_int in range(256))
+
+
+class _TableParser(HTMLParser):
+    """Collect the text of each row's <td> cells in the first HTML table."""
+
+    def __init__(self) -> None:
+        """Initialize the parser."""
+        super().__init__()
+        self.rows: list[list[str]] = []
+        self._in_table = False
+        self._done = False
+        self._cells: list[str] | None = None
+        self._cell: list[str] | None = None
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:  # noqa: ARG002
+        """Track entry into the table, its rows and data cells."""
+        if self._done:
+            return
+        if tag == "table":
+            self._in_table = True
+        elif self._in_table and tag == "tr":
+            self._cells = []
+        elif self._cells is not None and tag == "td":
+            self._close_cell()
+            self._cell = []
+
+    def handle_endtag(self, tag: str) -> None:
+        """Close cells and rows, stopping at the end of the first table."""
+        if self._done:
+            return
+        if tag == "td":
+            self._close_cell()
+        elif tag == "tr" and self._cells is not None:
+            # </td> is optional in HTML
+            self._close_cell()
+            self.rows.append(self._cells)
+            self._cells = None
+        elif tag == "table" and self._in_table:
+            self._done = True
+
+    def handle_data(self, data: str) -> None:
+        """Accumulate text inside a data cell."""
+        if self._cell is not None:
+            self._cell.append(data)
+
+    def _close_cell(self) -> None:
+        """Finish the open data cell, if any."""
+        if self._cell is not None and self._cells is not None:
+            self._cells.append("".join(self._cell))
+        self._cell = None
 
 
 class GoCoaxClient:
@@ -72,6 +213,7 @@ class GoCoaxClient:
         password: str = "gocoax",
         session: ClientSession | None = None,
         timeout: int = DEFAULT_TIMEOUT,
+        status_ttl: float = DEFAULT_STATUS_TTL,
     ) -> None:
         """Initialize the goCoax client."""
         self._host = host
@@ -80,12 +222,42 @@ class GoCoaxClient:
         self._session = session
         self._owns_session = session is None
         self._timeout = timeout
-        self._base_url = f"http://{host}"
+        self._host_url = f"http://{host}"
+        # resolved lazily on first request; hostnames are pinned to an address
+        self._base_url: str | None = None
+        # concurrent requests share a single lookup
+        self._resolve_lock = asyncio.Lock()
+        # endpoint -> parsed URL against the current base URL
+        self._urls: dict[str, URL] = {}
+        # credentials are fixed per client, so encode the header only once
+        self._headers = {hdrs.AUTHORIZATION: BasicAuth(username, password).encode()}
+        self._post_headers = {
+            **self._headers,
+            hdrs.CONTENT_TYPE: "application/x-www-form-urlencoded",
+        }
+        self._mac_address: str | None = None
+        # collapses repeated get_status calls within one poll window
+        self._status_ttl = status_ttl
+        self._status_cache: tuple[float, AdapterStatus] | None = None
+        # endpoint -> (monotonic fetch time, response)
+        self._cache: dict[str, tuple[float, dict | str]] = {}
 
     async def _get_session(self) -> ClientSession:
-        """Get or create aiohttp session."""
+        """Get or create aiohttp session.
+
+        A caller-provided session (e.g. Home Assistant's shared session) is
+        always reused so keep-alive connections survive across polls; a
+        private session is only created when none was given. Its connector
+        keeps idle connections alive between polls.
+        """
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            connector = aiohttp.TCPConnector(keepalive_timeout=KEEPALIVE_TIMEOUT)
+            self._session = aiohttp.ClientSession(connector=connector)
+            LOG.debug(
+                "Created private session for %s; pass a shared session to "
+                "pool connections across adapters",
+                self._host,
+            )
             self._owns_session = True
         return self._session
 
@@ -95,36 +267,116 @@ class GoCoaxClient:
             await self._session.close()
             self._session = None
 
+    async def _resolve_base_url(self) -> str:
+        """Resolve the adapter hostname once and pin requests to its address.
+
+        Avoids a DNS lookup for every new connection, which is notably slow
+        for mDNS (.local) names. IP addresses are used as-is.
+        """
+        try:
+            ipaddress.ip_address(self._host)
+        except ValueError:
+            pass
+        else:
+            return self._host_url
+
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(
+                self._host, 80, type=socket.SOCK_STREAM
+            )
+        except OSError as err:
+            # leave resolution to the connector
+            LOG.debug("Failed to resolve %s: %s", self._host, err)
+            return self._host_url
+
+        address = infos[0][4][0]
+        LOG.debug("Resolved %s to %s", self._host, address)
+        if ":" in address:
+            # a zone id ("%eth0") must be percent-encoded in a URL (RFC 6874)
+            return f"http://[{address.replace('%', '%25')}]"
+        return f"http://{address}"
+
+    async def _get_url(self, endpoint: str) -> URL:
+        """Return the URL for an endpoint, resolving the host if needed."""
+        if self._base_url is None:
+            async with self._resolve_lock:
+                # another request may have resolved it while we waited
+                if self._base_url is None:
+                    self._urls.clear()
+                    self._base_url = await self._resolve_base_url()
+        if (url := self._urls.get(endpoint)) is None:
+            url = self._urls[endpoint] = URL(f"{self._base_url}{endpoint}")
+        return url
+
     async def _request(self, endpoint: str, method: str = "GET") -> dict | str:
         """Make an authenticated request to the adapter."""
         session = await self._get_session()
-        url = f"{self._base_url}{endpoint}"
-        auth = BasicAuth(self._username, self._password)
 
         try:
+            # the lookup shares the request timeout, like a connector one
             async with asyncio.timeout(self._timeout):
+                url = await self._get_url(endpoint)
                 if method == "POST":
                     # goCoax uses funky POST with form data
-                    headers = {"content-type": "application/x-www-form-urlencoded"}
                     async with session.post(
-                        url, data='{"data":[2]}', auth=auth, headers=headers
+                        url, data='{"data":[2]}', headers=self._post_headers
                     ) as resp:
                         return await self._handle_response(resp, url)
                 else:
-                    async with session.get(url, auth=auth) as resp:
+                    async with session.get(url, headers=self._headers) as resp:
                         return await self._handle_response(resp, url)
 
         except TimeoutError as err:
+            self._request_failed(endpoint)
             raise GoCoaxTimeoutError(
                 f"Timeout connecting to goCoax adapter at {self._host}"
             ) from err
         except aiohttp.ClientError as err:
+            self._request_failed(endpoint)
             raise GoCoaxConnectionError(
                 f"Error connecting to goCoax adapter at {self._host}: {err}"
             ) from err
 
+    def _request_failed(self, endpoint: str) -> None:
+        """Reset per-connection state after a required endpoint fails."""
+        # a slow optional page says nothing about the adapter's address
+        if endpoint not in _REQUIRED_ENDPOINTS:
+            return
+        # address may be stale (e.g. new DHCP lease), re-resolve next time
+        self._base_url = None
+        self._status_cache = None
+
+    async def _request_cached(self, endpoint: str, ttl: float) -> dict | str:
+        """Make a GET request, reusing a response younger than ttl seconds."""
+        now = time.monotonic()
+        if (cached := self._cache.get(endpoint)) and now - cached[0] < ttl:
+            return cached[1]
+        resp = await self._request(endpoint)
+        self._cache[endpoint] = (now, resp)
+        return resp
+
+    async def _request_json(self, endpoint: str, ttl: float = 0) -> list:
+        """Request a JSON endpoint and return its data array."""
+        if ttl:
+            resp = await self._request_cached(endpoint, ttl)
+        else:
+            resp = await self._request(endpoint)
+        if not isinstance(resp, dict) or not isinstance(resp.get("data"), list):
+            raise GoCoaxParseError(f"Invalid response from goCoax adapter: {endpoint}")
+        return resp["data"]
+
+    async def _request_html(self, endpoint: str, ttl: float = 0) -> str:
+        """Request an HTML page and return its text."""
+        if ttl:
+            resp = await self._request_cached(endpoint, ttl)
+        else:
+            resp = await self._request(endpoint)
+        if not isinstance(resp, str):
+            raise GoCoaxParseError(f"Invalid response from goCoax adapter: {endpoint}")
+        return resp
+
     async def _handle_response(
-        self, resp: aiohttp.ClientResponse, url: str
+        self, resp: aiohttp.ClientResponse, url: URL
     ) -> dict | str:
         """Handle HTTP response."""
         if resp.status == 401:
@@ -136,103 +388,103 @@ class GoCoaxClient:
                 f"HTTP {resp.status} from goCoax adapter: {url}"
             )
 
-        content_type = resp.content_type or ""
-        if "json" in content_type or url.endswith("/GET"):
-            return await resp.json()
-        return await resp.text()
-
-    def _parse_hex_value(self, hex_str: str) -> int:
-        """Parse hex string to integer."""
+        # read raw bytes and decode ourselves; the adapter does not always
+        # label its JSON correctly, so skip aiohttp's content-type checks
+        body = await resp.read()
+        if resp.content_type in _JSON_CONTENT_TYPES or url.path.endswith("/GET"):
+            try:
+                return orjson.loads(body)
+            except orjson.JSONDecodeError as err:
+                raise GoCoaxParseError(
+                    f"Invalid JSON from goCoax adapter: {url}"
+                ) from err
+        charset = resp.charset or "utf-8"
         try:
-            return int(hex_str, 16)
-        except (ValueError, TypeError):
-            return 0
-
-    def _parse_64bit_value(self, data: list[str], high_idx: int) -> int:
-        """Parse 64-bit value from two consecutive hex strings."""
-        if high_idx + 1 >= len(data):
-            return 0
-        high = self._parse_hex_value(data[high_idx]) & 0xFFFFFFFF
-        low = self._parse_hex_value(data[high_idx + 1])
+            codecs.lookup(charset)
+        except LookupError:
+            # firmware may advertise a charset Python does not know
+            charset = "utf-8"
+        return body.decode(charset, "replace")
+
+    @staticmethod
+    def _join_64bit_words(high_word: str, low_word: str) -> int:
+        """Parse 64-bit value from its high and low 32-bit hex strings."""
+        # fast path: parse both "0x"-prefixed 32-bit words in one int() call;
+        # for 16 hex digits this is quicker than bytes.fromhex + int.from_bytes
+        try:
+            high_hex = high_word.lower().removeprefix("0x")[-8:]
+            low_hex = low_word.lower().removeprefix("0x")
+            if len(low_hex) <= 8:
+                return int(high_hex + low_hex.zfill(8), 16)
+        except (AttributeError, ValueError):
+            pass
+        high = _parse_hex(high_word) & 0xFFFFFFFF
+        low = _parse_hex(low_word)
         return (high * 4294967296) + low
 
-    def _hex_to_mac(self, hi: int, lo: int) -> str:
+    @staticmethod
+    def _hex_to_mac(hi: int, lo: int) -> str:
         """Convert two integers to MAC address string."""
-        # extract bytes: hi contains first 4 bytes, lo contains last 2
-        b1 = (hi >> 24) & 0xFF
-        b2 = (hi >> 16) & 0xFF
-        b3 = (hi >> 8) & 0xFF
-        b4 = hi & 0xFF
-        b5 = (lo >> 24) & 0xFF
-        b6 = (lo >> 16) & 0xFF
-        return f"{b1:02x}:{b2:02x}:{b3:02x}:{b4:02x}:{b5:02x}:{b6:02x}"
-
-    def _parse_moca_version(self, ver_int: int) -> str:
+        # hi contains first 4 bytes, upper half of lo contains last 2
+        mac = ((hi & 0xFFFFFFFF) << 16) | ((lo >> 16) & 0xFFFF)
+        return mac.to_bytes(6).hex(":")
+
+    @staticmethod
+    def _parse_moca_version(ver_int: int) -> str:
         """Parse MoCA version from integer value."""
-        # version is encoded as major * 16 + minor
-        if ver_int == 0x20:
-            return "2.0"
-        if ver_int == 0x25:
-            return "2.5"
-        if ver_int >= 0x20:
-            major = ver_int >> 4
-            minor = ver_int & 0x0F
-            return f"{major}.{minor}"
-        return "unknown"
+        if 0 <= ver_int < len(_MOCA_VERSIONS):
+            return _MOCA_VERSIONS[ver_int]
+        return _format_moca_version(ver_int)
 
     async def get_mac_address(self) -> str:
-        """Get the MAC address of the adapter."""
+        """Get the MAC address of the adapter.
+
+        The MAC never changes, so it is only fetched until first discovered.
+        """
+        if self._mac_address:
+            return self._mac_address
         try:
-            resp = await self._request(ENDPOINT_MAC)
-            if isinstance(resp, dict) and "data" in resp:
-                data = resp["data"]
-                if len(data) >= 2:
-                    hi = self._parse_hex_value(data[0])
-                    lo = self._parse_hex_value(data[1])
-                    return self._hex_to_mac(hi, lo)
+            data = await self._request_json(ENDPOINT_MAC)
+            if len(data) >= 2:
+                hi = _parse_hex(data[0])
+                lo = _parse_hex(data[1])
+                self._mac_address = self._hex_to_mac(hi, lo)
+                return self._mac_address
         except GoCoaxParseError:
             LOG.debug("Failed to parse MAC address")
         return ""
 
     async def get_local_info(self) -> dict:
         """Get local adapter info (link status, MoCA version, etc.)."""
-        resp = await self._request(ENDPOINT_LOCAL_INFO)
-        if isinstance(resp, dict) and "data" in resp:
-            data = resp["data"]
-            return {
-                "link_status": self._parse_hex_value(data[LOCAL_INFO_LINK_STATUS_IDX])
-                if len(data) > LOCAL_INFO_LINK_STATUS_IDX
-                else 0,
-                "moca_version": self._parse_hex_value(data[LOCAL_INFO_MOCA_VER_IDX])
-                if len(data) > LOCAL_INFO_MOCA_VER_IDX
-                else 0,
-                "node_id": self._parse_hex_value(data[LOCAL_INFO_NODE_ID_IDX])
-                if len(data) > LOCAL_INFO_NODE_ID_IDX
-                else 0,
-                "nc_node_id": self._parse_hex_value(data[LOCAL_INFO_NC_NODE_IDX])
-                if len(data) > LOCAL_INFO_NC_NODE_IDX
-                else 0,
-                "raw_data": data,
-            }
-        raise GoCoaxParseError("Invalid local info response")
+        data = await self._request_json(ENDPOINT_LOCAL_INFO)
+        # pad short responses once so missing fields parse as 0
+        fields = data
+        if len(fields) < _LOCAL_INFO_MIN_LEN:
+            fields = [*data, *["0x0"] * (_LOCAL_INFO_MIN_LEN - len(data))]
+        parse_hex = _parse_hex
+        return {
+            "link_status": parse_hex(fields[LOCAL_INFO_LINK_STATUS_IDX]),
+            "moca_version": parse_hex(fields[LOCAL_INFO_MOCA_VER_IDX]),
+            "node_id": parse_hex(fields[LOCAL_INFO_NODE_ID_IDX]),
+            "nc_node_id": parse_hex(fields[LOCAL_INFO_NC_NODE_IDX]),
+            "raw_data": data,
+        }
 
     async def get_frame_info(self) -> EthernetPackets:
         """Get ethernet tx/rx packet statistics."""
-        resp = await self._request(ENDPOINT_FRAME_INFO)
-        if isinstance(resp, dict) and "data" in resp:
-            data = resp["data"]
-            tx_good = self._parse_64bit_value(data, FRAME_TX_GOOD_IDX)
-            tx_bad = self._parse_64bit_value(data, FRAME_TX_BAD_IDX)
-            tx_drop = self._parse_64bit_value(data, FRAME_TX_DROP_IDX)
-            rx_good = self._parse_64bit_value(data, FRAME_RX_GOOD_IDX)
-            rx_bad = self._parse_64bit_value(data, FRAME_RX_BAD_IDX)
-            rx_drop = self._parse_64bit_value(data, FRAME_RX_DROP_IDX)
-
-            return EthernetPackets(
-                tx=PacketStats(ok=tx_good, bad=tx_bad, dropped=tx_drop),
-                rx=PacketStats(ok=rx_good, bad=rx_bad, dropped=rx_drop),
-            )
-        raise GoCoaxParseError("Invalid frame info response")
+        data = await self._request_json(ENDPOINT_FRAME_INFO)
+        # pad short responses once so missing counters parse as 0
+        if len(data) < _FRAME_INFO_MIN_LEN:
+            data = [*data, *["0x0"] * (_FRAME_INFO_MIN_LEN - len(data))]
+        join_words = self._join_64bit_words
+        counters: dict[str, dict[str, int]] = {"tx": {}, "rx": {}}
+        for direction, field, idx in _FRAME_LAYOUT:
+            counters[direction][field] = join_words(data[idx], data[idx + 1])
+
+        return EthernetPackets(
+            tx=PacketStats(**counters["tx"]),
+            rx=PacketStats(**counters["rx"]),
+        )
 
     async def get_node_info(self, local_node_id: int = -1) -> list[NetworkPeer]:
         """Get information about other nodes on the MoCA network.
@@ -243,48 +495,48 @@ class GoCoaxClient:
         """
         peers: list[NetworkPeer] = []
         try:
-            resp = await self._request(ENDPOINT_NODE_INFO)
-            if isinstance(resp, dict) and "data" in resp:
-                data = resp["data"]
-                LOG.debug("Node info response (raw): %s", data)
-
-                # typical format: 16 values per node
-                # [0]=node_id, [1]=mac_hi, [2]=mac_lo, [3]=moca_ver, ...
-                node_size = 16
-                if len(data) >= node_size:
-                    num_nodes = len(data) // node_size
-                    for i in range(num_nodes):
-                        offset = i * node_size
-                        node_id = self._parse_hex_value(data[offset])
-
-                        # skip local node and empty entries
-                        if node_id == local_node_id or node_id == 0:
-                            continue
-
-                        mac_hi = self._parse_hex_value(data[offset + 1])
-                        mac_lo = self._parse_hex_value(data[offset + 2])
-                        mac_addr = self._hex_to_mac(mac_hi, mac_lo)
-
-                        # skip if MAC is all zeros (empty slot)
-                        if mac_addr == "00:00:00:00:00:00":
-                            continue
-
-                        moca_ver_int = self._parse_hex_value(data[offset + 3])
-                        moca_ver = self._parse_moca_version(moca_ver_int)
-
-                        peers.append(
-                            NetworkPeer(
-                                node_id=node_id,
-                                mac_address=mac_addr,
-                                moca_version=moca_ver,
-                            )
-                        )
-                        LOG.debug(
-                            "Parsed peer: node_id=%d, mac=%s, version=%s",
-                            node_id,
-                            mac_addr,
-                            moca_ver,
-                        )
+            data = await self._request_json(ENDPOINT_NODE_INFO)
+            LOG.debug("Node info response (raw): %s", data)
+
+            # typical format: 16 values per node
+            # [0]=node_id, [1]=mac_hi, [2]=mac_lo, [3]=moca_ver, ...
+            node_size = 16
+            # bind hot-loop helpers locally to skip attribute lookups
+            parse_hex = _parse_hex
+            add_peer = peers.append
+            end = len(data) - len(data) % node_size
+            for offset in range(0, end, node_size):
+                node_id = parse_hex(data[offset])
+
+                # skip local node and empty entries
+                if node_id == local_node_id or node_id == 0:
+                    continue
+
+                mac_hi = parse_hex(data[offset + 1])
+                mac_lo = parse_hex(data[offset + 2])
+
+                # skip if MAC is all zeros (empty slot)
+                if not mac_hi & 0xFFFFFFFF and not (mac_lo >> 16) & 0xFFFF:
+                    continue
+
+                mac_addr = self._hex_to_mac(mac_hi, mac_lo)
+
+                moca_ver_int = parse_hex(data[offset + 3])
+                moca_ver = self._parse_moca_version(moca_ver_int)
+
+                add_peer(
+                    NetworkPeer(
+                        node_id=node_id,
+                        mac_address=mac_addr,
+                        moca_version=moca_ver,
+                    )
+                )
+                LOG.debug(
+                    "Parsed peer: node_id=%d, mac=%s, version=%s",
+                    node_id,
+                    mac_addr,
+                    moca_ver,
+                )
 
         except (GoCoaxConnectionError, GoCoaxParseError) as err:
             LOG.debug("Failed to get node info: %s", err)
@@ -294,48 +546,68 @@ class GoCoaxClient:
         """Parse PHY rates from the phyRates.html page."""
         rates: list[PhyRate] = []
         try:
-            html = await self._request(ENDPOINT_PHY_RATES)
-            if isinstance(html, str):
-                rates = self._parse_phy_rates_html(html)
+            html = await self._request_html(ENDPOINT_PHY_RATES)
+            rates = self._parse_phy_rates_html(html)
         except (GoCoaxConnectionError, GoCoaxParseError) as err:
-            LOG.debug(f"Failed to get PHY rates: {err}")
+            LOG.debug("Failed to get PHY rates: %s", err)
         return rates
 
     def _parse_phy_rates_html(self, html: str) -> list[PhyRate]:
         """Parse PHY rates table from HTML."""
-        rates: list[PhyRate] = []
+        # fast path: every row after the header is a plain mac/tx/rx row; the
+        # one row that does not match must be the first, which the parser
+        # below skips as the header
+        if table := _RE_FIRST_TABLE.search(html):
+            rows = list(_RE_PHY_RATE_ROW.finditer(table[0]))
+            tr_starts = [tr.start() for tr in _RE_TABLE_ROW.finditer(table[0])]
+            if (
+                rows
+                and len(tr_starts) == len(rows) + 1
+                and rows[0].start() != tr_starts[0]
+            ):
+                return [
+                    PhyRate(
+                        source_mac="",  # filled by caller
+                        target_mac=row[1].lower(),
+                        tx_rate=_parse_rate(row[2]),
+                        rx_rate=_parse_rate(row[3]),
+                    )
+                    for row in rows
+                ]
+
         # look for table with PHY rates
         # format varies by firmware, typical pattern:
         # MAC addr | TX rate | RX rate
-        table_match = re.search(
-            r"<table[^>]*>(.*?)</table>", html, re.IGNORECASE | re.DOTALL
+        parser = _TableParser()
+        parser.feed(html)
+        parser.close()
+
+        cells_by_mac = (
+            (self._find_mac(cells[0]), cells)
+            for cells in parser.rows[1:]  # skip header row
+            if len(cells) >= 3
         )
-        if not table_match:
-            return rates
-
-        table_html = table_match.group(1)
-        rows = re.findall(r"<tr[^>]*>(.*?)</tr>", table_html, re.IGNORECASE | re.DOTALL)
-
-        for row in rows[1:]:  # skip header row
-            cells = re.findall(r"<td[^>]*>(.*?)</td>", row, re.IGNORECASE | re.DOTALL)
-            if len(cells) >= 3:
-                mac_match = re.search(r"([0-9a-fA-F:]{17})", cells[0].strip())
-                if mac_match:
-                    mac = mac_match.group(1).lower()
-                    try:
-                        tx_rate = int(re.sub(r"[^\d]", "", cells[1]) or "0")
-                        rx_rate = int(re.sub(r"[^\d]", "", cells[2]) or "0")
-                        rates.append(
-                            PhyRate(
-                                source_mac="",  # filled by caller
-                                target_mac=mac,
-                                tx_rate=tx_rate,
-                                rx_rate=rx_rate,
-                            )
-                        )
-                    except ValueError:
-                        continue
-        return rates
+        return [
+            PhyRate(
+                source_mac="",  # filled by caller
+                target_mac=mac,
+                tx_rate=_parse_rate(cells[1]),
+                rx_rate=_parse_rate(cells[2]),
+            )
+            for mac, cells in cells_by_mac
+            if mac
+        ]
+
+    @staticmethod
+    def _find_mac(text: str) -> str | None:
+        """Return the lowercased MAC address found in a table cell, if any."""
+        candidate = text.strip().lower()
+        # common case: the cell holds just the MAC, no regex needed
+        if len(candidate) == 17 and _MAC_CHARS.issuperset(candidate):
+            return candidate
+        if mac_match := _RE_MAC.search(candidate):
+            return mac_match.group(1)
+        return None
 
     async def get_privacy_info(self) -> dict:
         """Get MoCA privacy/encryption settings.
@@ -344,14 +616,12 @@ class GoCoaxClient:
         """
         result: dict = {"encryption_enabled": None}
         try:
-            resp = await self._request(ENDPOINT_PRIVACY)
-            if isinstance(resp, dict) and "data" in resp:
-                data = resp["data"]
-                LOG.debug("Privacy info response (raw): %s", data)
-                # typical format: [0]=privacy_enabled (0=off, 1=on)
-                if len(data) >= 1:
-                    privacy_val = self._parse_hex_value(data[0])
-                    result["encryption_enabled"] = privacy_val == 1
+            data = await self._request_json(ENDPOINT_PRIVACY, STATIC_ENDPOINT_TTL)
+            LOG.debug("Privacy info response (raw): %s", data)
+            # typical format: [0]=privacy_enabled (0=off, 1=on)
+            if len(data) >= 1:
+                privacy_val = _parse_hex(data[0])
+                result["encryption_enabled"] = privacy_val == 1
         except (GoCoaxConnectionError, GoCoaxParseError) as err:
             LOG.debug("Failed to get privacy info: %s", err)
         return result
@@ -368,13 +638,11 @@ class GoCoaxClient:
             "bit_loading": None,
         }
         try:
-            resp = await self._request(ENDPOINT_FMR_INFO)
-            if isinstance(resp, dict) and "data" in resp:
-                data = resp["data"]
-                LOG.debug("FMR info response (raw): %s", data)
-                # format varies; log for analysis and attempt parsing
-                # commonly: SNR, power levels, modulation info
-                # will need real device data to finalize parsing
+            data = await self._request_json(ENDPOINT_FMR_INFO)
+            LOG.debug("FMR info response (raw): %s", data)
+            # format varies; log for analysis and attempt parsing
+            # commonly: SNR, power levels, modulation info
+            # will need real device data to finalize parsing
         except (GoCoaxConnectionError, GoCoaxParseError) as err:
             LOG.debug("Failed to get FMR info: %s", err)
         return result
@@ -390,77 +658,104 @@ class GoCoaxClient:
             "channel_count": None,
         }
         try:
-            resp = await self._request(ENDPOINT_CONFIG)
-            if isinstance(resp, dict) and "data" in resp:
-                data = resp["data"]
-                LOG.debug("Config info response (raw): %s", data)
-                # attempt to parse LOF and band configuration
-                # LOF is typically in MHz (e.g., 1125, 1400)
-                if len(data) >= 1:
-                    lof = self._parse_hex_value(data[0])
-                    if 1000 <= lof <= 1700:  # sanity check for MHz range
-                        result["lof"] = lof
-                        result["frequency_band"] = self._lof_to_band(lof)
+            data = await self._request_json(ENDPOINT_CONFIG, STATIC_ENDPOINT_TTL)
+            LOG.debug("Config info response (raw): %s", data)
+            # attempt to parse LOF and band configuration
+            # LOF is typically in MHz (e.g., 1125, 1400)
+            if len(data) >= 1:
+                lof = _parse_hex(data[0])
+                if 1000 <= lof <= 1700:  # sanity check for MHz range
+                    result["lof"] = lof
+                    result["frequency_band"] = self._lof_to_band(lof)
         except (GoCoaxConnectionError, GoCoaxParseError) as err:
             LOG.debug("Failed to get config info: %s", err)
         return result
 
-    def _lof_to_band(self, lof: int) -> str:
+    @staticmethod
+    def _lof_to_band(lof: int) -> str:
         """Convert LOF (lowest operating frequency) to band name."""
-        # MoCA 2.5 band definitions (approximate)
-        if lof >= 1400:
-            return "D-High"
-        if lof >= 1225:
-            return "D-Mid"
-        if lof >= 1125:
-            return "Extended-D"
-        if lof >= 1000:
-            return "D-Low"
+        idx = bisect_right(_LOF_BAND_THRESHOLDS, lof)
+        if idx:
+            return _LOF_BAND_NAMES[idx - 1]
         return f"Unknown ({lof} MHz)"
 
     async def get_status_page(self) -> dict:
         """Parse main status HTML page for additional info."""
         result: dict = {}
         try:
-            html = await self._request(ENDPOINT_STATUS_HTML)
-            if isinstance(html, str):
-                # look for common status values in HTML
-                # firmware version
-                fw_match = re.search(
-                    r"firmware[:\s]+([0-9.]+)",
-                    html,
-                    re.IGNORECASE,
-                )
-                if fw_match:
-                    result["firmware_version"] = fw_match.group(1)
-
-                # model name
-                model_match = re.search(
-                    r"model[:\s]+(MA\d+\w*|WF-\d+\w*|FCA\d+)",
-                    html,
-                    re.IGNORECASE,
-                )
-                if model_match:
-                    result["model"] = model_match.group(1).upper()
-
-                # channel count (sometimes shown)
-                channel_match = re.search(
-                    r"(\d+)\s*channels?",
-                    html,
-                    re.IGNORECASE,
-                )
-                if channel_match:
-                    result["channel_count"] = int(channel_match.group(1))
+            html = await self._request_html(ENDPOINT_STATUS_HTML, STATIC_ENDPOINT_TTL)
+            # look for common status values in HTML
+            # firmware version
+            if fw_match := _RE_FIRMWARE.search(html):
+                result["firmware_version"] = fw_match.group(1)
+
+            # model name
+            if model_match := _RE_MODEL.search(html):
+                result["model"] = model_match.group(1).upper()
+
+            # channel count (sometimes shown)
+            if channel_match := _RE_CHANNELS.search(html):
+                result["channel_count"] = int(channel_match.group(1))
 
-                LOG.debug("Status page parsed values: %s", result)
+            LOG.debug("Status page parsed values: %s", result)
         except (GoCoaxConnectionError, GoCoaxParseError) as err:
             LOG.debug("Failed to get status page: %s", err)
         return result
 
-    async def get_status(self) -> AdapterStatus:
-        """Get complete adapter status."""
-        mac_address = await self.get_mac_address()
+    async def get_device_info(self) -> dict:
+        """Get model and firmware version of the adapter."""
+        status_page = await self.get_status_page()
+        return {
+            "model": status_page.get("model"),
+            "firmware_version": status_page.get("firmware_version"),
+        }
+
+    async def _get_local_info_and_peers(self) -> tuple[dict, list[NetworkPeer]]:
+        """Get local info followed by the peers it identifies."""
         local_info = await self.get_local_info()
+        peers = await self.get_node_info(local_node_id=local_info.get("node_id", 0))
+        return local_info, peers
+
+    async def get_status(self) -> AdapterStatus:
+        """Get complete adapter status.
+
+        The MAC lookup is skipped once get_mac_address has discovered it. A
+        status fetched less than status_ttl seconds ago is returned as-is.
+        """
+        now = time.monotonic()
+        if (cached := self._status_cache) and now - cached[0] < self._status_ttl:
+            return cached[1]
+        status = await self._fetch_status()
+        self._status_cache = (now, status)
+        return status
+
+    async def _fetch_status(self) -> AdapterStatus:
+        """Fetch complete adapter status from all endpoints."""
+        # all endpoints are independent except node info, which needs the
+        # local node id; run them together, and cancel the rest as soon as a
+        # required endpoint fails instead of waiting for them
+        try:
+            async with asyncio.TaskGroup() as group:
+                mac_task = group.create_task(self.get_mac_address())
+                local_task = group.create_task(self._get_local_info_and_peers())
+                packets_task = group.create_task(self.get_frame_info())
+                phy_rates_task = group.create_task(self.get_phy_rates())
+                privacy_task = group.create_task(self.get_privacy_info())
+                config_task = group.create_task(self.get_config_info())
+                fmr_task = group.create_task(self.get_fmr_info())
+                status_page_task = group.create_task(self.get_status_page())
+        except ExceptionGroup as err:
+            # callers handle the client's own exceptions, not a group
+            raise err.exceptions[0] from None
+
+        mac_address = mac_task.result()
+        local_info, peers = local_task.result()
+        packets = packets_task.result()
+        phy_rates = phy_rates_task.result()
+        privacy_info = privacy_task.result()
+        config_info = config_task.result()
+        fmr_info = fmr_task.result()
+        status_page = status_page_task.result()
 
         link_status = local_info.get("link_status", 0) == 1
         moca_ver_int = local_info.get("moca_version", 0)
@@ -469,16 +764,6 @@ class GoCoaxClient:
         nc_node_id = local_info.get("nc_node_id", 0)
         is_nc = node_id == nc_node_id
 
-        packets = await self.get_frame_info()
-        peers = await self.get_node_info(local_node_id=node_id)
-        phy_rates = await self.get_phy_rates()
-
-        # fetch additional data for enhanced monitoring
-        privacy_info = await self.get_privacy_info()
-        config_info = await self.get_config_info()
-        fmr_info = await self.get_fmr_info()
-        status_page = await self.get_status_page()
-
         # fill in source mac for phy rates
         for rate in phy_rates:
             rate.source_mac = mac_address
@@ -519,12 +804,11 @@ class GoCoaxClient:
     async def test_connection(self) -> bool:
         """Test connection to the adapter."""
         try:
-            mac = await self.get_mac_address()
-            return bool(mac)
+            return bool(await self.get_mac_address())
         except GoCoaxAuthError:
             raise
         except GoCoaxConnectionError:
             raise
         except Exception as err:
-            LOG.debug(f"Connection test failed: {err}")
+            LOG.debug("Connection test failed: %s", err)
             return False
@@ -3,7 +3,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PacketStats:
     """Packet statistics for tx/rx."""
 
@@ -12,7 +12,7 @@ class PacketStats:
     dropped: int = 0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EthernetPackets:
     """Ethernet packet statistics."""
 
@@ -20,7 +20,7 @@ class EthernetPackets:
     rx: PacketStats = field(default_factory=PacketStats)
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkPeer:
     """Information about a peer on the MoCA network."""
 
@@ -31,7 +31,7 @@ class NetworkPeer:
     rx_phy_rate: int = 0  # Mbps
 
 
-@dataclass
+@dataclass(slots=True)
 class PhyRate:
     """PHY rate between two adapters."""
 
@@ -41,7 +41,7 @@ class PhyRate:
     rx_rate: int  # Mbps
 
 
-@dataclass
+@dataclass(slots=True)
 class SignalQuality:
     """Signal quality metrics for MoCA connection."""
 
@@ -51,7 +51,7 @@ class SignalQuality:
     bit_loading: int | None = None  # bits per symbol
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AdapterStatus:
     """Complete status of a goCoax MoCA adapter."""
 
@@ -82,6 +82,9 @@ class AdapterStatus:
 
     def to_dict(self) -> dict:
         """Convert to dictionary for diagnostics."""
+        # built directly rather than via asdict(), which deep-copies every field
+        tx, rx = self.packets.tx, self.packets.rx
+        signal = self.signal_quality
         return {
             "mac_address": self.mac_address,
             "ip_address": self.ip_address,
@@ -98,22 +101,14 @@ class AdapterStatus:
             "channel_count": self.channel_count,
             "encryption_enabled": self.encryption_enabled,
             "signal_quality": {
-                "snr": self.signal_quality.snr,
-                "tx_power": self.signal_quality.tx_power,
-                "rx_power": self.signal_quality.rx_power,
-                "bit_loading": self.signal_quality.bit_loading,
+                "snr": signal.snr,
+                "tx_power": signal.tx_power,
+                "rx_power": signal.rx_power,
+                "bit_loading": signal.bit_loading,
             },
             "packets": {
-                "tx": {
-                    "ok": self.packets.tx.ok,
-                    "bad": self.packets.tx.bad,
-                    "dropped": self.packets.tx.dropped,
-                },
-                "rx": {
-                    "ok": self.packets.rx.ok,
-                    "bad": self.packets.rx.bad,
-                    "dropped": self.packets.rx.dropped,
-                },
+                "tx": {"ok": tx.ok, "bad": tx.bad, "dropped": tx.dropped},
+                "rx": {"ok": rx.ok, "bad": rx.bad, "dropped": rx.dropped},
             },
             "network_peers": [
                 {
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 from collections.abc import Callable
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -15,7 +16,6 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.const import EntityCategory, UnitOfDataRate, UnitOfFrequency
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -27,11 +27,9 @@ from .const import (
     ATTR_TX_BAD,
     ATTR_TX_DROPPED,
     ATTR_TX_OK,
-    DOMAIN,
-    MANUFACTURER_GOCOAX,
 )
 from .coordinator import GoCoaxCoordinator
-from .pygocoax import AdapterStatus
+from .pygocoax import AdapterStatus, PhyRate
 
 LOG = logging.getLogger(__name__)
 
@@ -44,72 +42,91 @@ class GoCoaxSensorEntityDescription(SensorEntityDescription):
     extra_attrs_fn: Callable[[AdapterStatus], dict[str, Any]] | None = None
 
 
+@dataclass(frozen=True, kw_only=True)
+class GoCoaxPhyRateSensorEntityDescription(SensorEntityDescription):
+    """Describes a goCoax PHY rate sensor entity."""
+
+    rate_fn: Callable[[PhyRate], int]
+
+
+def _tx_packet_attrs(data: AdapterStatus) -> dict[str, Any]:
+    """Return the tx packet breakdown attributes."""
+    stats = data.packets.tx
+    return {
+        ATTR_TX_OK: stats.ok,
+        ATTR_TX_BAD: stats.bad,
+        ATTR_TX_DROPPED: stats.dropped,
+    }
+
+
+def _rx_packet_attrs(data: AdapterStatus) -> dict[str, Any]:
+    """Return the rx packet breakdown attributes."""
+    stats = data.packets.rx
+    return {
+        ATTR_RX_OK: stats.ok,
+        ATTR_RX_BAD: stats.bad,
+        ATTR_RX_DROPPED: stats.dropped,
+    }
+
+
 SENSOR_DESCRIPTIONS: tuple[GoCoaxSensorEntityDescription, ...] = (
     GoCoaxSensorEntityDescription(
         key="moca_version",
         translation_key="moca_version",
         icon="mdi:chip",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.moca_version,
+        value_fn=attrgetter("moca_version"),
     ),
     GoCoaxSensorEntityDescription(
         key="mac_address",
         translation_key="mac_address",
         icon="mdi:ethernet",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.mac_address,
+        value_fn=attrgetter("mac_address"),
     ),
     GoCoaxSensorEntityDescription(
         key="ip_address",
         translation_key="ip_address",
         icon="mdi:ip-network",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.ip_address,
+        value_fn=attrgetter("ip_address"),
     ),
     GoCoaxSensorEntityDescription(
         key="node_id",
         translation_key="node_id",
         icon="mdi:identifier",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.node_id,
+        value_fn=attrgetter("node_id"),
     ),
     GoCoaxSensorEntityDescription(
         key="tx_packets",
         translation_key="tx_packets",
         icon="mdi:upload-network",
         state_class=SensorStateClass.TOTAL_INCREASING,
-        value_fn=lambda data: data.packets.tx.ok,
-        extra_attrs_fn=lambda data: {
-            ATTR_TX_OK: data.packets.tx.ok,
-            ATTR_TX_BAD: data.packets.tx.bad,
-            ATTR_TX_DROPPED: data.packets.tx.dropped,
-        },
+        value_fn=attrgetter("packets.tx.ok"),
+        extra_attrs_fn=_tx_packet_attrs,
     ),
     GoCoaxSensorEntityDescription(
         key="rx_packets",
         translation_key="rx_packets",
         icon="mdi:download-network",
         state_class=SensorStateClass.TOTAL_INCREASING,
-        value_fn=lambda data: data.packets.rx.ok,
-        extra_attrs_fn=lambda data: {
-            ATTR_RX_OK: data.packets.rx.ok,
-            ATTR_RX_BAD: data.packets.rx.bad,
-            ATTR_RX_DROPPED: data.packets.rx.dropped,
-        },
+        value_fn=attrgetter("packets.rx.ok"),
+        extra_attrs_fn=_rx_packet_attrs,
     ),
     GoCoaxSensorEntityDescription(
         key="peer_count",
         translation_key="peer_count",
         icon="mdi:lan",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.peer_count,
+        value_fn=attrgetter("peer_count"),
     ),
     GoCoaxSensorEntityDescription(
         key="frequency_band",
         translation_key="frequency_band",
         icon="mdi:sine-wave",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.frequency_band,
+        value_fn=attrgetter("frequency_band"),
     ),
     GoCoaxSensorEntityDescription(
         key="lof",
@@ -117,7 +134,7 @@ SENSOR_DESCRIPTIONS: tuple[GoCoaxSensorEntityDescription, ...] = (
         icon="mdi:waveform",
         native_unit_of_measurement=UnitOfFrequency.MEGAHERTZ,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.lof,
+        value_fn=attrgetter("lof"),
     ),
     GoCoaxSensorEntityDescription(
         key="channel_count",
@@ -125,11 +142,26 @@ SENSOR_DESCRIPTIONS: tuple[GoCoaxSensorEntityDescription, ...] = (
         icon="mdi:numeric",
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.channel_count,
+        value_fn=attrgetter("channel_count"),
     ),
 )
 
 
+# per-peer PHY rate sensors share these
+PHY_RATE_DESCRIPTIONS: dict[str, GoCoaxPhyRateSensorEntityDescription] = {
+    direction: GoCoaxPhyRateSensorEntityDescription(
+        key=f"phy_{direction}_rate",
+        translation_key=f"phy_{direction}_rate",
+        icon="mdi:speedometer",
+        device_class=SensorDeviceClass.DATA_RATE,
+        native_unit_of_measurement=UnitOfDataRate.MEGABITS_PER_SECOND,
+        state_class=SensorStateClass.MEASUREMENT,
+        rate_fn=attrgetter(f"{direction}_rate"),
+    )
+    for direction in ("tx", "rx")
+}
+
+
 async def async_setup_entry(
     hass: HomeAssistant,  # noqa: ARG001
     entry: GoCoaxConfigEntry,
@@ -138,7 +170,7 @@ async def async_setup_entry(
     """Set up goCoax sensor entities."""
     coordinator = entry.runtime_data
 
-    entities: list[GoCoaxSensor] = []
+    entities: list[GoCoaxSensor | GoCoaxPhyRateSensor] = []
 
     # add standard sensors
     for description in SENSOR_DESCRIPTIONS:
@@ -147,48 +179,16 @@ async def async_setup_entry(
     # add PHY rate sensors for each peer
     if coordinator.data and coordinator.data.phy_rates:
         for idx, phy_rate in enumerate(coordinator.data.phy_rates):
-            # tx rate sensor
-            entities.append(
-                GoCoaxPhyRateSensor(
-                    coordinator,
-                    GoCoaxSensorEntityDescription(
-                        key=f"phy_tx_rate_{idx}",
-                        translation_key="phy_tx_rate",
-                        icon="mdi:speedometer",
-                        device_class=SensorDeviceClass.DATA_RATE,
-                        native_unit_of_measurement=UnitOfDataRate.MEGABITS_PER_SECOND,
-                        state_class=SensorStateClass.MEASUREMENT,
-                        value_fn=lambda data, i=idx: (
-                            data.phy_rates[i].tx_rate
-                            if i < len(data.phy_rates)
-                            else None
-                        ),
-                    ),
-                    phy_rate.target_mac,
-                    "tx",
-                )
-            )
-            # rx rate sensor
-            entities.append(
-                GoCoaxPhyRateSensor(
-                    coordinator,
-                    GoCoaxSensorEntityDescription(
-                        key=f"phy_rx_rate_{idx}",
-                        translation_key="phy_rx_rate",
-                        icon="mdi:speedometer",
-                        device_class=SensorDeviceClass.DATA_RATE,
-                        native_unit_of_measurement=UnitOfDataRate.MEGABITS_PER_SECOND,
-                        state_class=SensorStateClass.MEASUREMENT,
-                        value_fn=lambda data, i=idx: (
-                            data.phy_rates[i].rx_rate
-                            if i < len(data.phy_rates)
-                            else None
-                        ),
-                    ),
-                    phy_rate.target_mac,
-                    "rx",
+            for direction, phy_description in PHY_RATE_DESCRIPTIONS.items():
+                entities.append(
+                    GoCoaxPhyRateSensor(
+                        coordinator,
+                        phy_description,
+                        idx,
+                        phy_rate.target_mac,
+                        direction,
+                    )
                 )
-            )
 
     async_add_entities(entities)
 
@@ -208,56 +208,60 @@ class GoCoaxSensor(CoordinatorEntity[GoCoaxCoordinator], SensorEntity):
         super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.mac_address}_{description.key}"
-        self._attr_device_info = self._build_device_info()
-
-    def _build_device_info(self) -> DeviceInfo:
-        """Build device info for this sensor."""
-        data = self.coordinator.data
-        return DeviceInfo(
-            identifiers={
-                (DOMAIN, self.coordinator.mac_address or self.coordinator.host)
-            },
-            connections={(CONNECTION_NETWORK_MAC, data.mac_address)} if data else set(),
-            name=f"goCoax {self.coordinator.host}",
-            manufacturer=MANUFACTURER_GOCOAX,
-            model=data.model if data else None,
-            sw_version=data.firmware_version if data else None,
-            configuration_url=f"http://{self.coordinator.host}",
-        )
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> Any:
         """Return the sensor value."""
-        if not self.coordinator.data:
+        if (data := self.coordinator.data) is None:
             return None
-        return self.entity_description.value_fn(self.coordinator.data)
+        return self.entity_description.value_fn(data)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return extra state attributes."""
-        if not self.coordinator.data or not self.entity_description.extra_attrs_fn:
+        data = self.coordinator.data
+        extra_attrs_fn = self.entity_description.extra_attrs_fn
+        if data is None or extra_attrs_fn is None:
             return None
-        return self.entity_description.extra_attrs_fn(self.coordinator.data)
+        return extra_attrs_fn(data)
 
 
-class GoCoaxPhyRateSensor(GoCoaxSensor):
+class GoCoaxPhyRateSensor(CoordinatorEntity[GoCoaxCoordinator], SensorEntity):
     """PHY rate sensor for peer connections."""
 
+    entity_description: GoCoaxPhyRateSensorEntityDescription
+    _attr_has_entity_name = True
+
     def __init__(
         self,
         coordinator: GoCoaxCoordinator,
-        description: GoCoaxSensorEntityDescription,
+        description: GoCoaxPhyRateSensorEntityDescription,
+        idx: int,
         target_mac: str,
         direction: str,
     ) -> None:
         """Initialize the PHY rate sensor."""
-        super().__init__(coordinator, description)
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_device_info = coordinator.device_info
+        self._idx = idx
         self._target_mac = target_mac
         self._direction = direction
         # update unique_id to include target mac
         short_mac = target_mac.replace(":", "")[-6:]
         self._attr_unique_id = f"{coordinator.mac_address}_phy_{direction}_{short_mac}"
 
+    @property
+    def native_value(self) -> int | None:
+        """Return the PHY rate of this sensor's peer."""
+        if (data := self.coordinator.data) is None:
+            return None
+        phy_rates = data.phy_rates
+        if self._idx >= len(phy_rates):
+            return None
+        return self.entity_description.rate_fn(phy_rates[self._idx])
+
     @property
     def name(self) -> str:
         """Return the name of the sensor."""
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 from collections.abc import Generator
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
+from homeassistant.config_entries import SOURCE_USER, ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
 
+from custom_components.gocoax.const import DOMAIN
 from custom_components.gocoax.pygocoax import (
     AdapterStatus,
     EthernetPackets,
@@ -31,8 +34,27 @@ def mock_config_entry_data() -> dict:
 
 
 @pytest.fixture
+def registered_entry(hass: HomeAssistant, mock_config_entry_data: dict) -> ConfigEntry:
+    """Return a config entry added to hass."""
+    entry = ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=DOMAIN,
+        title=f"goCoax ({MOCK_HOST})",
+        data=mock_config_entry_data,
+        source=SOURCE_USER,
+        unique_id=MOCK_MAC,
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.fixture(scope="session")
 def mock_adapter_status() -> AdapterStatus:
-    """Return mock adapter status."""
+    """Return mock adapter status.
+
+    Built once per session; tests must treat it as read-only.
+    """
     return AdapterStatus(
         mac_address=MOCK_MAC,
         ip_address=MOCK_HOST,
@@ -55,14 +77,19 @@ def mock_adapter_status() -> AdapterStatus:
 @pytest.fixture
 def mock_gocoax_client(mock_adapter_status: AdapterStatus) -> Generator[MagicMock]:
     """Mock GoCoaxClient."""
+    # spec (not autospec) still rejects unknown attributes and makes async
+    # methods AsyncMocks, without autospec's per-test signature introspection
     with patch(
-        "custom_components.gocoax.config_flow.GoCoaxClient", autospec=True
+        "custom_components.gocoax.config_flow.GoCoaxClient", spec=True
     ) as mock_client_class:
         mock_client = mock_client_class.return_value
-        mock_client.get_mac_address = AsyncMock(return_value=MOCK_MAC)
-        mock_client.get_status = AsyncMock(return_value=mock_adapter_status)
-        mock_client.test_connection = AsyncMock(return_value=True)
-        mock_client.close = AsyncMock()
+        mock_client.get_mac_address.return_value = MOCK_MAC
+        mock_client.get_device_info.return_value = {
+            "model": "MA2500D",
+            "firmware_version": "2.0.11",
+        }
+        mock_client.get_status.return_value = mock_adapter_status
+        mock_client.test_connection.return_value = True
         yield mock_client
 
 
@@ -72,10 +99,13 @@ def mock_coordinator_client(
 ) -> Generator[MagicMock]:
     """Mock GoCoaxClient for coordinator tests."""
     with patch(
-        "custom_components.gocoax.coordinator.GoCoaxClient", autospec=True
+        "custom_components.gocoax.coordinator.GoCoaxClient", spec=True
     ) as mock_client_class:
         mock_client = mock_client_class.return_value
-        mock_client.get_mac_address = AsyncMock(return_value=MOCK_MAC)
-        mock_client.get_status = AsyncMock(return_value=mock_adapter_status)
-        mock_client.close = AsyncMock()
+        mock_client.get_mac_address.return_value = MOCK_MAC
+        mock_client.get_device_info.return_value = {
+            "model": "MA2500D",
+            "firmware_version": "2.0.11",
+        }
+        mock_client.get_status.return_value = mock_adapter_status
         yield mock_client
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
+import pytest
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
@@ -49,17 +50,25 @@ async def test_user_flow_success(
     assert result["result"].unique_id == MOCK_MAC
 
 
-async def test_user_flow_cannot_connect(
+@pytest.mark.parametrize(
+    ("exc", "error"),
+    [
+        (GoCoaxConnectionError("Connection failed"), "cannot_connect"),
+        (GoCoaxAuthError("Auth failed"), "invalid_auth"),
+    ],
+)
+async def test_user_flow_client_error(
     hass: HomeAssistant,
+    exc: Exception,
+    error: str,
 ) -> None:
-    """Test user flow when connection fails."""
+    """Test user flow reports client errors on the form."""
     with patch(
-        "custom_components.gocoax.config_flow.GoCoaxClient"
+        "custom_components.gocoax.config_flow.GoCoaxClient", spec=True
     ) as mock_client_class:
         mock_client = mock_client_class.return_value
-        mock_client.get_mac_address = AsyncMock(
-            side_effect=GoCoaxConnectionError("Connection failed")
-        )
+        mock_client.get_mac_address.side_effect = exc
+        mock_client.get_device_info.side_effect = exc
 
         result = await hass.config_entries.flow.async_init(
             DOMAIN, context={"source": config_entries.SOURCE_USER}
@@ -75,20 +84,19 @@ async def test_user_flow_cannot_connect(
         )
 
         assert result["type"] == FlowResultType.FORM
-        assert result["errors"] == {"base": "cannot_connect"}
+        assert result["errors"] == {"base": error}
 
 
-async def test_user_flow_invalid_auth(
+async def test_user_flow_device_info_auth_error(
     hass: HomeAssistant,
 ) -> None:
-    """Test user flow when authentication fails."""
+    """Test user flow reports auth failure from the device info request."""
     with patch(
-        "custom_components.gocoax.config_flow.GoCoaxClient"
+        "custom_components.gocoax.config_flow.GoCoaxClient", spec=True
     ) as mock_client_class:
         mock_client = mock_client_class.return_value
-        mock_client.get_mac_address = AsyncMock(
-            side_effect=GoCoaxAuthError("Auth failed")
-        )
+        mock_client.get_mac_address.return_value = MOCK_MAC
+        mock_client.get_device_info.side_effect = GoCoaxAuthError("Auth failed")
 
         result = await hass.config_entries.flow.async_init(
             DOMAIN, context={"source": config_entries.SOURCE_USER}
@@ -110,21 +118,9 @@ async def test_user_flow_invalid_auth(
 async def test_user_flow_duplicate(
     hass: HomeAssistant,
     mock_gocoax_client,  # noqa: ARG001
-    mock_config_entry_data,
+    registered_entry,  # noqa: ARG001
 ) -> None:
     """Test user flow when adapter is already configured."""
-    # create existing entry
-    entry = config_entries.ConfigEntry(
-        version=1,
-        minor_version=1,
-        domain=DOMAIN,
-        title=f"goCoax ({MOCK_HOST})",
-        data=mock_config_entry_data,
-        source=config_entries.SOURCE_USER,
-        unique_id=MOCK_MAC,
-    )
-    entry.add_to_hass(hass)
-
     result = await hass.config_entries.flow.async_init(
         DOMAIN, context={"source": config_entries.SOURCE_USER}
     )
@@ -144,21 +140,10 @@ async def test_user_flow_duplicate(
 
 async def test_options_flow(
     hass: HomeAssistant,
-    mock_config_entry_data,
+    registered_entry,
 ) -> None:
     """Test options flow."""
-    entry = config_entries.ConfigEntry(
-        version=1,
-        minor_version=1,
-        domain=DOMAIN,
-        title=f"goCoax ({MOCK_HOST})",
-        data=mock_config_entry_data,
-        source=config_entries.SOURCE_USER,
-        unique_id=MOCK_MAC,
-    )
-    entry.add_to_hass(hass)
-
-    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_init(registered_entry.entry_id)
 
     assert result["type"] == FlowResultType.FORM
     assert result["step_id"] == "init"
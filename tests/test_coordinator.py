@@ -3,10 +3,8 @@
 from __future__ import annotations
 
 from datetime import timedelta
-from unittest.mock import AsyncMock, patch
 
 import pytest
-from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import UpdateFailed
@@ -20,39 +18,17 @@ from custom_components.gocoax.pygocoax.exceptions import (
     GoCoaxTimeoutError,
 )
 
-from .conftest import MOCK_HOST, MOCK_MAC, MOCK_PASSWORD, MOCK_USERNAME
-
-
-@pytest.fixture
-def mock_entry(hass: HomeAssistant):
-    """Create mock config entry."""
-    from homeassistant import config_entries
-
-    entry = config_entries.ConfigEntry(
-        version=1,
-        minor_version=1,
-        domain=DOMAIN,
-        title=f"goCoax ({MOCK_HOST})",
-        data={
-            CONF_HOST: MOCK_HOST,
-            CONF_USERNAME: MOCK_USERNAME,
-            CONF_PASSWORD: MOCK_PASSWORD,
-        },
-        source=config_entries.SOURCE_USER,
-        unique_id=MOCK_MAC,
-    )
-    entry.add_to_hass(hass)
-    return entry
+from .conftest import MOCK_MAC
 
 
 async def test_coordinator_update_success(
     hass: HomeAssistant,
-    mock_entry,
+    registered_entry,
     mock_adapter_status: AdapterStatus,  # noqa: ARG001
     mock_coordinator_client,  # noqa: ARG001
 ) -> None:
     """Test successful coordinator update."""
-    coordinator = GoCoaxCoordinator(hass, mock_entry)
+    coordinator = GoCoaxCoordinator(hass, registered_entry)
 
     await coordinator.async_config_entry_first_refresh()
 
@@ -62,79 +38,163 @@ async def test_coordinator_update_success(
     assert coordinator.data.moca_version == "2.5"
 
 
-async def test_coordinator_auth_error(
+@pytest.mark.parametrize(
+    ("exc", "expected"),
+    [
+        (GoCoaxAuthError("Auth failed"), ConfigEntryAuthFailed),
+        (GoCoaxConnectionError("Connection failed"), UpdateFailed),
+    ],
+)
+async def test_coordinator_client_error(
     hass: HomeAssistant,
-    mock_entry,
+    registered_entry,
+    mock_coordinator_client,
+    exc: Exception,
+    expected: type[Exception],
 ) -> None:
-    """Test coordinator handles auth error."""
-    with patch(
-        "custom_components.gocoax.coordinator.GoCoaxClient"
-    ) as mock_client_class:
-        mock_client = mock_client_class.return_value
-        mock_client.get_status = AsyncMock(side_effect=GoCoaxAuthError("Auth failed"))
+    """Test coordinator surfaces client errors on first refresh."""
+    mock_coordinator_client.get_status.side_effect = exc
 
-        coordinator = GoCoaxCoordinator(hass, mock_entry)
+    coordinator = GoCoaxCoordinator(hass, registered_entry)
 
-        with pytest.raises(ConfigEntryAuthFailed):
-            await coordinator.async_config_entry_first_refresh()
+    with pytest.raises(expected):
+        await coordinator.async_config_entry_first_refresh()
 
 
-async def test_coordinator_connection_error(
+async def test_coordinator_auth_error_retry_succeeds(
     hass: HomeAssistant,
-    mock_entry,
+    registered_entry,
+    mock_adapter_status: AdapterStatus,
+    mock_coordinator_client,
 ) -> None:
-    """Test coordinator handles connection error."""
-    with patch(
-        "custom_components.gocoax.coordinator.GoCoaxClient"
-    ) as mock_client_class:
-        mock_client = mock_client_class.return_value
-        mock_client.get_status = AsyncMock(
-            side_effect=GoCoaxConnectionError("Connection failed")
-        )
+    """Test coordinator retries once on a transient auth error."""
+    mock_coordinator_client.get_status.side_effect = [
+        GoCoaxAuthError("Auth failed"),
+        mock_adapter_status,
+    ]
 
-        coordinator = GoCoaxCoordinator(hass, mock_entry)
+    coordinator = GoCoaxCoordinator(hass, registered_entry)
 
-        with pytest.raises(UpdateFailed):
-            await coordinator.async_config_entry_first_refresh()
+    await coordinator.async_config_entry_first_refresh()
+
+    assert coordinator.data is mock_adapter_status
+    assert mock_coordinator_client.get_status.await_count == 2
 
 
 async def test_coordinator_timeout_with_stale_data(
     hass: HomeAssistant,
-    mock_entry,
+    registered_entry,
     mock_adapter_status: AdapterStatus,
+    mock_coordinator_client,
 ) -> None:
     """Test coordinator returns stale data on timeout."""
-    with patch(
-        "custom_components.gocoax.coordinator.GoCoaxClient"
-    ) as mock_client_class:
-        mock_client = mock_client_class.return_value
-        # first call succeeds, subsequent calls timeout
-        mock_client.get_status = AsyncMock(
-            side_effect=[
-                mock_adapter_status,
-                GoCoaxTimeoutError("Timeout"),
-            ]
-        )
-
-        coordinator = GoCoaxCoordinator(hass, mock_entry)
-
-        # first update succeeds
-        await coordinator.async_config_entry_first_refresh()
-        assert coordinator.data is not None
-        assert coordinator.data.mac_address == MOCK_MAC
+    # first call succeeds, subsequent calls timeout
+    mock_coordinator_client.get_status.side_effect = [
+        mock_adapter_status,
+        GoCoaxTimeoutError("Timeout"),
+    ]
+
+    coordinator = GoCoaxCoordinator(hass, registered_entry)
+
+    # first update succeeds
+    await coordinator.async_config_entry_first_refresh()
+    assert coordinator.data is not None
+    assert coordinator.data.mac_address == MOCK_MAC
+
+    # second update returns stale data
+    await coordinator.async_refresh()
+    # should still have data (stale)
+    assert coordinator.data is not None
+
+
+async def test_coordinator_discovers_mac_once(
+    hass: HomeAssistant,
+    registered_entry,
+    mock_coordinator_client,
+) -> None:
+    """Test MAC address is discovered once during setup, not per poll."""
+    coordinator = GoCoaxCoordinator(hass, registered_entry)
+
+    await coordinator.async_config_entry_first_refresh()
+    await coordinator.async_refresh()
+
+    assert coordinator.mac_address == MOCK_MAC
+    mock_coordinator_client.get_mac_address.assert_awaited_once()
+    mock_coordinator_client.get_status.assert_awaited_with()
+
+
+async def test_coordinator_backoff_on_errors(
+    hass: HomeAssistant,
+    registered_entry,
+    mock_adapter_status: AdapterStatus,
+    mock_coordinator_client,
+) -> None:
+    """Test coordinator backs off polling after errors and resets on success."""
+    mock_coordinator_client.get_status.side_effect = [
+        mock_adapter_status,
+        GoCoaxConnectionError("Connection failed"),
+        GoCoaxTimeoutError("Timeout"),
+        mock_adapter_status,
+    ]
+
+    coordinator = GoCoaxCoordinator(hass, registered_entry)
+    await coordinator.async_config_entry_first_refresh()
+
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == timedelta(seconds=DEFAULT_SCAN_INTERVAL * 2)
+
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == timedelta(seconds=DEFAULT_SCAN_INTERVAL * 4)
+    assert coordinator.consecutive_errors == 2
+
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+    assert coordinator.consecutive_errors == 0
+
+
+async def test_coordinator_status_dict_cached(
+    hass: HomeAssistant,
+    registered_entry,
+    mock_coordinator_client,  # noqa: ARG001
+) -> None:
+    """Test status dict is serialized once per data instance."""
+    coordinator = GoCoaxCoordinator(hass, registered_entry)
+    assert coordinator.status_dict is None
+
+    await coordinator.async_config_entry_first_refresh()
+
+    status_dict = coordinator.status_dict
+    assert status_dict is not None
+    assert status_dict["mac_address"] == MOCK_MAC
+    assert coordinator.status_dict is status_dict
+
+
+async def test_coordinator_device_info_shared(
+    hass: HomeAssistant,
+    registered_entry,
+    mock_coordinator_client,
+) -> None:
+    """Test device info is built once during setup and shared across entities."""
+    coordinator = GoCoaxCoordinator(hass, registered_entry)
+    await coordinator.async_config_entry_first_refresh()
+
+    device_info = coordinator.device_info
+    assert device_info["identifiers"] == {(DOMAIN, MOCK_MAC)}
+    assert device_info["manufacturer"] == "goCoax"
+    assert device_info["model"] == "MA2500D"
+    assert device_info["sw_version"] == "2.0.11"
 
-        # second update returns stale data
-        await coordinator.async_refresh()
-        # should still have data (stale)
-        assert coordinator.data is not None
+    await coordinator.async_refresh()
+    assert coordinator.device_info is device_info
+    mock_coordinator_client.get_device_info.assert_awaited_once()
 
 
 async def test_coordinator_update_interval(
     hass: HomeAssistant,
-    mock_entry,
+    registered_entry,
     mock_coordinator_client,  # noqa: ARG001
 ) -> None:
     """Test coordinator uses correct update interval."""
-    coordinator = GoCoaxCoordinator(hass, mock_entry)
+    coordinator = GoCoaxCoordinator(hass, registered_entry)
 
     assert coordinator.update_interval == timedelta(seconds=DEFAULT_SCAN_INTERVAL)
@@ -2,51 +2,38 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
+from types import SimpleNamespace
+
 import pytest
-from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD
 from homeassistant.core import HomeAssistant
 
-from custom_components.gocoax.const import DOMAIN
 from custom_components.gocoax.diagnostics import async_get_config_entry_diagnostics
 from custom_components.gocoax.pygocoax import AdapterStatus
 
-from .conftest import MOCK_HOST, MOCK_MAC, MOCK_PASSWORD, MOCK_USERNAME
+from .conftest import MOCK_HOST
 
 
-@pytest.fixture
-def mock_entry_with_coordinator(
-    hass: HomeAssistant, mock_adapter_status: AdapterStatus
-):
-    """Create mock config entry with coordinator."""
-    from datetime import timedelta
-    from unittest.mock import MagicMock
-
-    from homeassistant import config_entries
-
-    entry = config_entries.ConfigEntry(
-        version=1,
-        minor_version=1,
-        domain=DOMAIN,
-        title=f"goCoax ({MOCK_HOST})",
-        data={
-            CONF_HOST: MOCK_HOST,
-            CONF_USERNAME: MOCK_USERNAME,
-            CONF_PASSWORD: MOCK_PASSWORD,
-        },
-        source=config_entries.SOURCE_USER,
-        unique_id=MOCK_MAC,
+def _mock_coordinator(mock_adapter_status: AdapterStatus) -> SimpleNamespace:
+    """Return a stand-in coordinator holding the given adapter status."""
+    return SimpleNamespace(
+        data=mock_adapter_status,
+        status_dict=mock_adapter_status.to_dict(),
+        last_update_success=True,
+        update_interval=timedelta(seconds=30),
+        consecutive_errors=0,
     )
-    entry.add_to_hass(hass)
 
-    # mock coordinator
-    coordinator = MagicMock()
-    coordinator.data = mock_adapter_status
-    coordinator.last_update_success = True
-    coordinator.update_interval = timedelta(seconds=30)
 
-    entry.runtime_data = coordinator
-
-    return entry
+@pytest.fixture
+def mock_entry_with_coordinator(
+    registered_entry: ConfigEntry, mock_adapter_status: AdapterStatus
+) -> ConfigEntry:
+    """Return the registered config entry with a mock coordinator."""
+    registered_entry.runtime_data = _mock_coordinator(mock_adapter_status)
+    return registered_entry
 
 
 async def test_diagnostics_redacts_sensitive_data(
@@ -39,17 +39,17 @@ If you must change these patterns, existing users will need to:
 
 from __future__ import annotations
 
-import pytest
-
-# domain constant must match the integration
-DOMAIN = 'gocoax'
+from functools import cache
+from itertools import product
 
+import pytest
 
 # -----------------------------------------------------------------------------
 # Unique ID generation functions (must match actual entity code exactly)
 # -----------------------------------------------------------------------------
 
 
+@cache
 def generate_standard_unique_id(mac_address: str, description_key: str) -> str:
     """Generate unique_id for standard sensor/binary_sensor entities.
 
@@ -59,6 +59,7 @@ def generate_standard_unique_id(mac_address: str, description_key: str) -> str:
     return f'{mac_address}_{description_key}'
 
 
+@cache
 def generate_phy_rate_unique_id(
     mac_address: str, direction: str, target_mac: str
 ) -> str:
@@ -77,7 +78,7 @@ def generate_phy_rate_unique_id(
 # -----------------------------------------------------------------------------
 
 # sensor entity description keys from sensor.py
-SENSOR_DESCRIPTION_KEYS = [
+SENSOR_DESCRIPTION_KEYS = (
     'moca_version',
     'mac_address',
     'ip_address',
@@ -88,29 +89,59 @@ SENSOR_DESCRIPTION_KEYS = [
     'frequency_band',
     'lof',
     'channel_count',
-]
+)
 
 # binary_sensor entity description keys from binary_sensor.py
-BINARY_SENSOR_DESCRIPTION_KEYS = [
+BINARY_SENSOR_DESCRIPTION_KEYS = (
     'link_status',
     'network_controller',
     'encryption_enabled',
-]
+)
 
 # representative MAC addresses to test various formatting scenarios
-TEST_MAC_ADDRESSES = [
+TEST_MAC_ADDRESSES = (
     'a4:81:7a:49:e3:dd',
     'AA:BB:CC:DD:EE:FF',
     '00:11:22:33:44:55',
+)
+
+# representative target MACs for PHY rate sensors, with their short_mac
+TEST_TARGET_MACS = {
+    'b5:92:8b:5a:f4:ee': '5af4ee',
+    '11:22:33:aa:bb:cc': 'aabbcc',
+    'DE:AD:BE:EF:12:34': 'EF1234',
+}
+
+# PHY rate directions
+_DIRECTIONS = ('tx', 'rx')
+
+# flat (mac, key) cases with precomputed ids so collection skips id inference
+SENSOR_CASES = list(product(TEST_MAC_ADDRESSES, SENSOR_DESCRIPTION_KEYS))
+SENSOR_CASE_IDS = [f'{key}-{mac}' for mac, key in SENSOR_CASES]
+BINARY_SENSOR_CASES = list(
+    product(TEST_MAC_ADDRESSES, BINARY_SENSOR_DESCRIPTION_KEYS)
+)
+BINARY_SENSOR_CASE_IDS = [f'{key}-{mac}' for mac, key in BINARY_SENSOR_CASES]
+
+# PHY rate cases with the expected short_mac taken from the literal table
+PHY_RATE_CASES = [
+    (mac_address, direction, target_mac, short_mac)
+    for mac_address in TEST_MAC_ADDRESSES
+    for direction in _DIRECTIONS
+    for target_mac, short_mac in TEST_TARGET_MACS.items()
 ]
-
-# representative target MACs for PHY rate sensors
-TEST_TARGET_MACS = [
-    'b5:92:8b:5a:f4:ee',
-    '11:22:33:aa:bb:cc',
-    'DE:AD:BE:EF:12:34',
+PHY_RATE_CASE_IDS = [
+    f'{target_mac}-{direction}-{mac_address}'
+    for mac_address, direction, target_mac, _ in PHY_RATE_CASES
 ]
 
+# target MACs paired with their expected short_mac suffix
+SHORT_MAC_CASES = (
+    ('aa:bb:cc:dd:ee:ff', 'ddeeff'),
+    ('11:22:33:44:55:66', '445566'),
+    ('AA:BB:CC:DD:EE:FF', 'DDEEFF'),
+)
+
 
 # -----------------------------------------------------------------------------
 # Standard sensor entity unique_id tests
@@ -120,8 +151,9 @@ TEST_TARGET_MACS = [
 class TestSensorUniqueIdStability:
     """Test standard sensor entity unique_id stability."""
 
-    @pytest.mark.parametrize('mac_address', TEST_MAC_ADDRESSES)
-    @pytest.mark.parametrize('description_key', SENSOR_DESCRIPTION_KEYS)
+    @pytest.mark.parametrize(
+        ('mac_address', 'description_key'), SENSOR_CASES, ids=SENSOR_CASE_IDS
+    )
     def test_sensor_unique_id_format(
         self, mac_address: str, description_key: str
     ) -> None:
@@ -163,8 +195,11 @@ class TestSensorUniqueIdStability:
 class TestBinarySensorUniqueIdStability:
     """Test binary sensor entity unique_id stability."""
 
-    @pytest.mark.parametrize('mac_address', TEST_MAC_ADDRESSES)
-    @pytest.mark.parametrize('description_key', BINARY_SENSOR_DESCRIPTION_KEYS)
+    @pytest.mark.parametrize(
+        ('mac_address', 'description_key'),
+        BINARY_SENSOR_CASES,
+        ids=BINARY_SENSOR_CASE_IDS,
+    )
     def test_binary_sensor_unique_id_format(
         self, mac_address: str, description_key: str
     ) -> None:
@@ -204,11 +239,17 @@ class TestBinarySensorUniqueIdStability:
 class TestPhyRateSensorUniqueIdStability:
     """Test PHY rate sensor entity unique_id stability."""
 
-    @pytest.mark.parametrize('mac_address', TEST_MAC_ADDRESSES)
-    @pytest.mark.parametrize('direction', ['tx', 'rx'])
-    @pytest.mark.parametrize('target_mac', TEST_TARGET_MACS)
+    @pytest.mark.parametrize(
+        ('mac_address', 'direction', 'target_mac', 'expected_short_mac'),
+        PHY_RATE_CASES,
+        ids=PHY_RATE_CASE_IDS,
+    )
     def test_phy_rate_unique_id_format(
-        self, mac_address: str, direction: str, target_mac: str
+        self,
+        mac_address: str,
+        direction: str,
+        target_mac: str,
+        expected_short_mac: str,
     ) -> None:
         """Verify PHY rate sensor unique_id format remains stable."""
         unique_id = generate_phy_rate_unique_id(mac_address, direction, target_mac)
@@ -218,7 +259,6 @@ class TestPhyRateSensorUniqueIdStability:
         assert f'_phy_{direction}_' in unique_id, f'must contain _phy_{direction}_: {unique_id}'
 
         # short_mac should be last 6 chars of target MAC without colons
-        expected_short_mac = target_mac.replace(':', '')[-6:]
         assert unique_id.endswith(expected_short_mac), (
             f'must end with short_mac {expected_short_mac}: {unique_id}'
         )
@@ -245,13 +285,7 @@ class TestPhyRateSensorUniqueIdStability:
     def test_short_mac_extraction(self) -> None:
         """Verify short_mac is correctly extracted from target MAC."""
         # the short_mac should be the last 6 characters of the MAC with colons removed
-        test_cases = [
-            ('aa:bb:cc:dd:ee:ff', 'ddeeff'),
-            ('11:22:33:44:55:66', '445566'),
-            ('AA:BB:CC:DD:EE:FF', 'DDEEFF'),
-        ]
-
-        for target_mac, expected_short_mac in test_cases:
+        for target_mac, expected_short_mac in SHORT_MAC_CASES:
             unique_id = generate_phy_rate_unique_id(
                 'a4:81:7a:49:e3:dd', 'tx', target_mac
             )
@@ -286,25 +320,18 @@ class TestCrossEntityConsistency:
         """Verify no collisions between entity unique_ids for same device."""
         mac_address = 'a4:81:7a:49:e3:dd'
         target_mac = 'b5:92:8b:5a:f4:ee'
-        all_ids: set[str] = set()
-
-        # collect all sensor ids
-        for description_key in SENSOR_DESCRIPTION_KEYS:
-            uid = generate_standard_unique_id(mac_address, description_key)
-            assert uid not in all_ids, f'duplicate unique_id: {uid}'
-            all_ids.add(uid)
-
-        # collect all binary sensor ids
-        for description_key in BINARY_SENSOR_DESCRIPTION_KEYS:
-            uid = generate_standard_unique_id(mac_address, description_key)
-            assert uid not in all_ids, f'duplicate unique_id: {uid}'
-            all_ids.add(uid)
-
-        # collect PHY rate sensor ids
-        for direction in ['tx', 'rx']:
-            uid = generate_phy_rate_unique_id(mac_address, direction, target_mac)
-            assert uid not in all_ids, f'duplicate unique_id: {uid}'
-            all_ids.add(uid)
+        entity_keys = SENSOR_DESCRIPTION_KEYS + BINARY_SENSOR_DESCRIPTION_KEYS
+
+        # build every id for the device in one pass; any collision shrinks the set
+        all_ids = {
+            generate_standard_unique_id(mac_address, key) for key in entity_keys
+        } | {
+            generate_phy_rate_unique_id(mac_address, direction, target_mac)
+            for direction in _DIRECTIONS
+        }
+        assert len(all_ids) == len(entity_keys) + len(_DIRECTIONS), (
+            f'duplicate unique_id among {sorted(all_ids)}'
+        )
 
     def test_sensor_and_binary_sensor_use_same_pattern(self) -> None:
         """Verify sensor and binary_sensor entities use the same unique_id pattern."""
@@ -2,11 +2,36 @@
 
 from __future__ import annotations
 
+import asyncio
+import socket
+import time
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+import pytest
+from yarl import URL
+
 from custom_components.gocoax.pygocoax import (
     AdapterStatus,
     EthernetPackets,
     GoCoaxClient,
+    GoCoaxConnectionError,
+    GoCoaxParseError,
+    GoCoaxTimeoutError,
+    NetworkPeer,
     PacketStats,
+    PhyRate,
+    SignalQuality,
+)
+from custom_components.gocoax.pygocoax.client import (
+    _JSON_CONTENT_TYPES,
+    ENDPOINT_LOCAL_INFO,
+    ENDPOINT_PHY_RATES,
+    KEEPALIVE_TIMEOUT,
+    STATIC_ENDPOINT_TTL,
+    _parse_hex,
 )
 
 
@@ -19,21 +44,26 @@ class TestGoCoaxClient:
         # from decoded data: 0xa4817a49, 0xe3dd0000
         mac = client._hex_to_mac(0xA4817A49, 0xE3DD0000)
         assert mac == "a4:81:7a:49:e3:dd"
+        assert client._hex_to_mac(0, 0) == "00:00:00:00:00:00"
+        assert client._hex_to_mac(0x1A4817A49, 0x1E3DD0000) == "a4:81:7a:49:e3:dd"
 
-    def test_parse_hex_value(self) -> None:
+    def test_parse_hex(self) -> None:
         """Test hex string parsing."""
-        client = GoCoaxClient("192.168.1.1")
-        assert client._parse_hex_value("0x000683cf") == 426959
-        assert client._parse_hex_value("0x0014c6cd") == 1361613
-        assert client._parse_hex_value("invalid") == 0
-        assert client._parse_hex_value(None) == 0
+        assert _parse_hex("0x000683cf") == 426959
+        assert _parse_hex("0x0014c6cd") == 1361613
+        assert _parse_hex("invalid") == 0
+        assert _parse_hex(None) == 0
+        assert _parse_hex("") == 0
+        assert _parse_hex(["0x1"]) == 0
+        assert _parse_hex({"value": "0x1"}) == 0
 
-    def test_parse_64bit_value(self) -> None:
+    def test_join_64bit_words(self) -> None:
         """Test 64-bit value parsing from hex strings."""
         client = GoCoaxClient("192.168.1.1")
-        data = ["0x00000000", "0x000683cf"]
-        result = client._parse_64bit_value(data, 0)
-        assert result == 426959
+        assert client._join_64bit_words("0x00000000", "0x000683cf") == 426959
+        assert client._join_64bit_words("0x1", "0xff") == (1 << 32) + 0xFF
+        assert client._join_64bit_words("0x1ffffffff", "0x0") == 0xFFFFFFFF << 32
+        assert client._join_64bit_words("n/a", "0x10") == 16
 
     def test_parse_moca_version(self) -> None:
         """Test MoCA version parsing."""
@@ -41,6 +71,18 @@ class TestGoCoaxClient:
         assert client._parse_moca_version(0x25) == "2.5"
         assert client._parse_moca_version(0x20) == "2.0"
         assert client._parse_moca_version(0) == "unknown"
+        assert client._parse_moca_version(-1) == "unknown"
+        assert client._parse_moca_version(0x100) == "16.0"
+
+    def test_lof_to_band(self) -> None:
+        """Test LOF to band name mapping at the band edges."""
+        client = GoCoaxClient("192.168.1.1")
+        assert client._lof_to_band(999) == "Unknown (999 MHz)"
+        assert client._lof_to_band(1000) == "D-Low"
+        assert client._lof_to_band(1125) == "Extended-D"
+        assert client._lof_to_band(1224) == "Extended-D"
+        assert client._lof_to_band(1225) == "D-Mid"
+        assert client._lof_to_band(1400) == "D-High"
 
     def test_parse_phy_rates_html(self) -> None:
         """Test PHY rates HTML parsing."""
@@ -57,12 +99,544 @@ class TestGoCoaxClient:
         assert rates[0].tx_rate == 2500
         assert rates[0].rx_rate == 2400
 
+    def test_parse_phy_rates_html_nested_markup(self) -> None:
+        """Test PHY rates parsing ignores markup inside cells."""
+        client = GoCoaxClient("192.168.1.1")
+        html = """
+        <table class="rates">
+            <tr><td>MAC</td><td>TX</td><td>RX</td></tr>
+            <tr><td><b>A4:81:7A:49:E3:DD</b><td><span class="r2">2500</span> Mbps
+                <td>2400 Mbps</tr>
+        </table>
+        <table><tr><td>x</td></tr><tr><td>00:11:22:33:44:55</td></tr></table>
+        """
+        rates = client._parse_phy_rates_html(html)
+        assert len(rates) == 1
+        assert rates[0].target_mac == "a4:81:7a:49:e3:dd"
+        assert rates[0].tx_rate == 2500
+        assert rates[0].rx_rate == 2400
+
+    def test_parse_phy_rates_html_mixed_rows(self) -> None:
+        """Test a table with one marked-up row is still parsed in full."""
+        client = GoCoaxClient("192.168.1.1")
+        html = """
+        <table>
+            <tr><th>MAC</th><th>TX</th><th>RX</th></tr>
+            <tr><td>a4:81:7a:49:e3:dd</td><td>2500 Mbps</td><td>2400 Mbps</td></tr>
+            <tr><td><b>00:11:22:33:44:55</b></td><td>1,200 Mbps</td><td>900</td></tr>
+        </table>
+        """
+        rates = client._parse_phy_rates_html(html)
+        assert [(r.target_mac, r.tx_rate, r.rx_rate) for r in rates] == [
+            ("a4:81:7a:49:e3:dd", 2500, 2400),
+            ("00:11:22:33:44:55", 1200, 900),
+        ]
+
+    def test_parse_phy_rates_html_unmatched_row_not_first(self) -> None:
+        """Test the fast path is not taken when the odd row is not the header."""
+        client = GoCoaxClient("192.168.1.1")
+        html = """
+        <table>
+            <tr><td>a4:81:7a:49:e3:dd</td><td>2500 Mbps</td><td>2400 Mbps</td></tr>
+            <tr><td><b>00:11:22:33:44:55</b></td><td>1,200 Mbps</td><td>900</td></tr>
+        </table>
+        """
+        rates = client._parse_phy_rates_html(html)
+        assert [(r.target_mac, r.tx_rate, r.rx_rate) for r in rates] == [
+            ("00:11:22:33:44:55", 1200, 900),
+        ]
+
+    def test_find_mac(self) -> None:
+        """Test MAC extraction from PHY rate table cells."""
+        client = GoCoaxClient("192.168.1.1")
+        assert client._find_mac(" A4:81:7A:49:E3:DD ") == "a4:81:7a:49:e3:dd"
+        assert client._find_mac("Node 2 (a4:81:7a:49:e3:dd)") == "a4:81:7a:49:e3:dd"
+        assert client._find_mac("Node 2") is None
+
     def test_parse_phy_rates_html_no_table(self) -> None:
         """Test PHY rates parsing with no table."""
         client = GoCoaxClient("192.168.1.1")
         rates = client._parse_phy_rates_html("<html></html>")
         assert rates == []
 
+    async def test_shared_session_reused(self) -> None:
+        """Test a caller-provided session is used and never closed."""
+        session = MagicMock(closed=False)
+        session.close = AsyncMock()
+        client = GoCoaxClient("192.168.1.1", session=session)
+
+        assert await client._get_session() is session
+        assert await client._get_session() is session
+
+        await client.close()
+        session.close.assert_not_called()
+
+    async def test_private_session_connector(self) -> None:
+        """Test a private session keeps connections alive between polls."""
+        client = GoCoaxClient("192.168.1.1")
+        session = await client._get_session()
+        try:
+            assert session.connector._keepalive_timeout == KEEPALIVE_TIMEOUT
+        finally:
+            await client.close()
+        assert session.closed
+
+    async def test_request_default_concurrency(self) -> None:
+        """Test independent requests overlap on one client."""
+        in_flight = 0
+        peak = 0
+
+        @asynccontextmanager
+        async def fake_get(*_args, **_kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            yield MagicMock(status=200, content_type="text/html")
+            in_flight -= 1
+
+        session = MagicMock(closed=False)
+        session.get = fake_get
+        client = GoCoaxClient("192.168.1.1", session=session)
+
+        with patch.object(client, "_handle_response", AsyncMock(return_value="")):
+            await asyncio.gather(
+                client._request("/ms/1/0x103/GET"), client._request("/index.html")
+            )
+
+        assert peak == 2
+
+    async def test_request_reuses_url_and_auth_header(self) -> None:
+        """Test requests reuse the parsed URL and precomputed auth header."""
+        seen_headers = []
+        seen_urls = []
+
+        @asynccontextmanager
+        async def fake_get(url, headers):
+            seen_urls.append(url)
+            seen_headers.append(headers)
+            yield MagicMock(status=200, content_type="text/html")
+
+        session = MagicMock(closed=False)
+        session.get = fake_get
+        client = GoCoaxClient("192.168.1.1", session=session)
+
+        with patch.object(client, "_handle_response", AsyncMock(return_value="")):
+            await client._request("/index.html")
+            await client._request("/index.html")
+
+        assert seen_headers[0] is seen_headers[1]
+        assert seen_urls[0] is seen_urls[1]
+        assert seen_urls[0] == URL("http://192.168.1.1/index.html")
+        assert seen_headers[0]["Authorization"] == "Basic YWRtaW46Z29jb2F4"
+
+    async def test_handle_response_decoding(self) -> None:
+        """Test response bodies are decoded by endpoint and content type."""
+        client = GoCoaxClient("192.168.1.1")
+
+        def make_resp(body: bytes, content_type: str) -> MagicMock:
+            resp = MagicMock(status=200, content_type=content_type, charset=None)
+            resp.read = AsyncMock(return_value=body)
+            return resp
+
+        resp = make_resp(b'{"data": ["0x1"]}', "text/html")
+        assert await client._handle_response(resp, URL("http://h/ms/1/0x103/GET")) == {
+            "data": ["0x1"]
+        }
+        resp = make_resp(b"<html>ok</html>", "text/html")
+        assert await client._handle_response(resp, URL("http://h/index.html")) == (
+            "<html>ok</html>"
+        )
+        for content_type in _JSON_CONTENT_TYPES:
+            resp = make_resp(b'{"data": []}', content_type)
+            assert await client._handle_response(resp, URL("http://h/ms/0/0x15")) == {
+                "data": []
+            }
+        resp = make_resp(b'{"data": []}', "application/vnd.gocoax+json")
+        assert await client._handle_response(resp, URL("http://h/ms/0/0x15")) == (
+            '{"data": []}'
+        )
+        resp = make_resp(b"<html>", "application/json")
+        with pytest.raises(GoCoaxParseError):
+            await client._handle_response(resp, URL("http://h/ms/0/0x15"))
+
+    async def test_handle_response_unknown_charset(self) -> None:
+        """Test an unknown charset falls back to utf-8."""
+        client = GoCoaxClient("192.168.1.1")
+        resp = MagicMock(status=200, content_type="text/html", charset="bogus")
+        resp.read = AsyncMock(return_value="<html>café</html>".encode())
+        assert await client._handle_response(resp, URL("http://h/index.html")) == (
+            "<html>café</html>"
+        )
+
+    async def test_request_typed_responses(self) -> None:
+        """Test JSON and HTML requests reject the wrong response shape."""
+        client = GoCoaxClient("192.168.1.1")
+        with patch.object(client, "_request", AsyncMock(return_value="<html>")):
+            with pytest.raises(GoCoaxParseError):
+                await client._request_json("/ms/0/0x15")
+            assert await client._request_html("/index.html") == "<html>"
+        with patch.object(client, "_request", AsyncMock(return_value={"data": []})):
+            assert await client._request_json("/ms/0/0x15") == []
+            with pytest.raises(GoCoaxParseError):
+                await client._request_html("/index.html")
+
+    async def test_request_error_resets_base_url(self) -> None:
+        """Test a failed required endpoint re-resolves the adapter next time."""
+        session = MagicMock(closed=False)
+        session.get = MagicMock(side_effect=aiohttp.ClientError("refused"))
+        client = GoCoaxClient("192.168.1.1", session=session)
+
+        for _ in range(2):
+            with pytest.raises(GoCoaxConnectionError):
+                await client._request(ENDPOINT_LOCAL_INFO)
+            assert client._base_url is None
+        assert session.get.call_count == 2
+
+    async def test_optional_endpoint_failure_keeps_poll(self) -> None:
+        """Test a failed optional page leaves the other fields populated."""
+        responses = {
+            "/ms/1/0x103/GET": {"data": ["0xa4817a49", "0xe3dd0000"]},
+            ENDPOINT_LOCAL_INFO: {
+                "data": ["0x0"] * 5 + ["0x1"] + ["0x0"] * 5 + ["0x25"]
+            },
+            "/ms/0/0x14": {"data": ["0x0", "0x7"] + ["0x0"] * 30},
+            "/ms/0/0x19": {"data": []},
+            "/ms/0/0x17": {"data": ["0x1"]},
+            "/ms/0/0x1A": {"data": ["0x465"]},
+            "/ms/0/0x1D": {"data": []},
+            "/index.html": "Firmware: 2.0.11",
+        }
+
+        @asynccontextmanager
+        async def fake_get(url, headers):  # noqa: ARG001
+            if url.path == ENDPOINT_PHY_RATES:
+                raise aiohttp.ClientError("reset")
+            yield MagicMock(url=url)
+
+        session = MagicMock(closed=False)
+        session.get = fake_get
+        client = GoCoaxClient("192.168.1.1", session=session)
+
+        async def fake_handle_response(resp, url):  # noqa: ARG001
+            return responses[url.path]
+
+        with patch.object(client, "_handle_response", fake_handle_response):
+            status = await client.get_status()
+
+        assert status.phy_rates == []
+        assert status.mac_address == "a4:81:7a:49:e3:dd"
+        assert status.link_status is True
+        assert status.encryption_enabled is True
+        assert status.lof == 1125
+        assert status.firmware_version == "2.0.11"
+        assert client._cache
+
+    async def test_resolve_base_url_ip(self) -> None:
+        """Test IP address hosts are used without a DNS lookup."""
+        client = GoCoaxClient("192.168.1.1")
+        with patch.object(
+            asyncio.get_running_loop(), "getaddrinfo", AsyncMock()
+        ) as mock_getaddrinfo:
+            assert await client._resolve_base_url() == "http://192.168.1.1"
+        mock_getaddrinfo.assert_not_called()
+
+    async def test_resolve_base_url_hostname(self) -> None:
+        """Test hostnames are pinned to their resolved address."""
+        client = GoCoaxClient("gocoax.local")
+        infos = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("192.168.1.50", 80))]
+        with patch.object(
+            asyncio.get_running_loop(), "getaddrinfo", AsyncMock(return_value=infos)
+        ):
+            assert await client._resolve_base_url() == "http://192.168.1.50"
+
+        with patch.object(
+            asyncio.get_running_loop(),
+            "getaddrinfo",
+            AsyncMock(side_effect=socket.gaierror("no such host")),
+        ):
+            assert await client._resolve_base_url() == "http://gocoax.local"
+
+    async def test_resolve_base_url_scoped_ipv6(self) -> None:
+        """Test an IPv6 zone id is percent-encoded in the pinned URL."""
+        client = GoCoaxClient("gocoax.local")
+        sockaddr = ("fe80::1%eth0", 80, 0, 2)
+        infos = [(socket.AF_INET6, socket.SOCK_STREAM, 6, "", sockaddr)]
+        with patch.object(
+            asyncio.get_running_loop(), "getaddrinfo", AsyncMock(return_value=infos)
+        ):
+            assert await client._resolve_base_url() == "http://[fe80::1%25eth0]"
+
+    async def test_request_resolves_once(self) -> None:
+        """Test concurrent requests share one hostname lookup."""
+
+        @asynccontextmanager
+        async def fake_get(*_args, **_kwargs):
+            yield MagicMock(status=200, content_type="text/html")
+
+        async def slow_getaddrinfo(*_args, **_kwargs):
+            await asyncio.sleep(0)
+            return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("192.168.1.50", 80))]
+
+        session = MagicMock(closed=False)
+        session.get = fake_get
+        client = GoCoaxClient("gocoax.local", session=session)
+
+        with (
+            patch.object(client, "_handle_response", AsyncMock(return_value="")),
+            patch.object(
+                asyncio.get_running_loop(),
+                "getaddrinfo",
+                AsyncMock(side_effect=slow_getaddrinfo),
+            ) as mock_getaddrinfo,
+        ):
+            await asyncio.gather(*(client._request("/index.html") for _ in range(3)))
+
+        mock_getaddrinfo.assert_awaited_once()
+        assert client._urls["/index.html"] == URL("http://192.168.1.50/index.html")
+
+    async def test_request_resolve_timeout(self) -> None:
+        """Test a hung hostname lookup is bounded by the request timeout."""
+
+        async def hung_getaddrinfo(*_args, **_kwargs):
+            await asyncio.sleep(3600)
+
+        session = MagicMock(closed=False)
+        client = GoCoaxClient("gocoax.local", session=session, timeout=0.01)
+
+        with (
+            patch.object(
+                asyncio.get_running_loop(),
+                "getaddrinfo",
+                AsyncMock(side_effect=hung_getaddrinfo),
+            ),
+            pytest.raises(GoCoaxTimeoutError),
+        ):
+            await client._request(ENDPOINT_LOCAL_INFO)
+        session.get.assert_not_called()
+
+    async def test_get_device_info(self) -> None:
+        """Test device info is parsed from the status page."""
+        client = GoCoaxClient("192.168.1.1")
+        html = "<html>Model: MA2500D Firmware: 2.0.11</html>"
+        with patch.object(client, "_request", AsyncMock(return_value=html)):
+            info = await client.get_device_info()
+        assert info == {"model": "MA2500D", "firmware_version": "2.0.11"}
+
+    async def test_get_status_page(self) -> None:
+        """Test status page values are taken from their first occurrence."""
+        client = GoCoaxClient("192.168.1.1")
+        html = (
+            "<html>Model: ma2500d<br>Firmware: 2.0.11<br>8 channels"
+            "<br>Firmware: 1.0.0</html>"
+        )
+        with patch.object(client, "_request", AsyncMock(return_value=html)):
+            result = await client.get_status_page()
+        assert result == {
+            "model": "MA2500D",
+            "firmware_version": "2.0.11",
+            "channel_count": 8,
+        }
+
+        # one value's match must not hide another that overlaps it
+        client = GoCoaxClient("192.168.1.1")
+        html = "<html>Firmware: 4 channels</html>"
+        with patch.object(client, "_request", AsyncMock(return_value=html)):
+            result = await client.get_status_page()
+        assert result == {"firmware_version": "4", "channel_count": 4}
+
+    async def test_static_endpoints_cached(self) -> None:
+        """Test slowly-changing endpoints are fetched once within their TTL."""
+        client = GoCoaxClient("192.168.1.1")
+        html = "<html>Model: MA2500D Firmware: 2.0.11</html>"
+        with patch.object(
+            client, "_request", AsyncMock(return_value=html)
+        ) as mock_request:
+            await client.get_status_page()
+            await client.get_status_page()
+            assert mock_request.await_count == 1
+
+            with patch(
+                "custom_components.gocoax.pygocoax.client.time.monotonic",
+                return_value=time.monotonic() + STATIC_ENDPOINT_TTL,
+            ):
+                await client.get_status_page()
+            assert mock_request.await_count == 2
+
+    async def test_get_local_info_short_response(self) -> None:
+        """Test fields missing from a short local info response read as 0."""
+        client = GoCoaxClient("192.168.1.1")
+        data = ["0x0", "0x0", "0x0", "0x2", "0x1", "0x1"]
+        with patch.object(client, "_request", AsyncMock(return_value={"data": data})):
+            info = await client.get_local_info()
+        assert info == {
+            "link_status": 1,
+            "moca_version": 0,
+            "node_id": 2,
+            "nc_node_id": 1,
+            "raw_data": data,
+        }
+
+    async def test_get_frame_info(self) -> None:
+        """Test frame counters are read from their fixed offsets."""
+        client = GoCoaxClient("192.168.1.1")
+        data = ["0x0"] * 104
+        for offset, value in ((12, 1), (30, 2), (48, 3), (66, 4), (84, 5), (102, 6)):
+            data[offset + 1] = hex(value)
+        data[12] = "0x1"
+        with patch.object(client, "_request", AsyncMock(return_value={"data": data})):
+            packets = await client.get_frame_info()
+        assert packets == EthernetPackets(
+            tx=PacketStats(ok=(1 << 32) + 1, bad=2, dropped=3),
+            rx=PacketStats(ok=4, bad=5, dropped=6),
+        )
+
+        with patch.object(
+            client, "_request", AsyncMock(return_value={"data": data[:50]})
+        ):
+            packets = await client.get_frame_info()
+        assert packets == EthernetPackets(
+            tx=PacketStats(ok=(1 << 32) + 1, bad=2, dropped=3),
+            rx=PacketStats(),
+        )
+
+    async def test_get_node_info_skips_local_and_empty(self) -> None:
+        """Test node info skips the local node and empty MAC slots."""
+        client = GoCoaxClient("192.168.1.1")
+        padding = ["0x0"] * 12
+        data = [
+            *["0x1", "0xa4817a49", "0xe3dd0000", "0x25", *padding],
+            *["0x2", "0x0", "0x0", "0x25", *padding],
+            *["0x3", "0x11223344", "0x55660000", "0x20", *padding],
+        ]
+        with patch.object(client, "_request", AsyncMock(return_value={"data": data})):
+            peers = await client.get_node_info(local_node_id=1)
+        assert peers == [
+            NetworkPeer(node_id=3, mac_address="11:22:33:44:55:66", moca_version="2.0")
+        ]
+
+    async def test_get_mac_address_cached(self) -> None:
+        """Test the MAC address is only fetched until discovered."""
+        client = GoCoaxClient("192.168.1.1")
+        resp = {"data": ["0xa4817a49", "0xe3dd0000"]}
+        with patch.object(
+            client, "_request", AsyncMock(return_value=resp)
+        ) as mock_request:
+            assert await client.get_mac_address() == "a4:81:7a:49:e3:dd"
+            client._request_failed(ENDPOINT_LOCAL_INFO)
+            assert await client.test_connection()
+        assert mock_request.await_count == 1
+
+    async def test_get_status_fanout(self) -> None:
+        """Test get_status combines concurrently fetched endpoints."""
+        client = GoCoaxClient("192.168.1.1")
+        local_info = {"link_status": 1, "moca_version": 0x25, "node_id": 2}
+        peers = [
+            NetworkPeer(node_id=3, mac_address="aa:bb:cc:dd:ee:ff", moca_version="2.5")
+        ]
+        packets = EthernetPackets(tx=PacketStats(), rx=PacketStats())
+        with (
+            patch.object(
+                client,
+                "get_mac_address",
+                AsyncMock(return_value="a4:81:7a:49:e3:dd"),
+            ),
+            patch.object(client, "get_local_info", AsyncMock(return_value=local_info)),
+            patch.object(
+                client, "get_node_info", AsyncMock(return_value=peers)
+            ) as mock_node_info,
+            patch.object(client, "get_frame_info", AsyncMock(return_value=packets)),
+            patch.object(client, "get_phy_rates", AsyncMock(return_value=[])),
+            patch.object(client, "get_privacy_info", AsyncMock(return_value={})),
+            patch.object(client, "get_config_info", AsyncMock(return_value={})),
+            patch.object(client, "get_fmr_info", AsyncMock(return_value={})),
+            patch.object(
+                client, "get_status_page", AsyncMock(return_value={"model": "MA2500D"})
+            ),
+        ):
+            status = await client.get_status()
+
+        mock_node_info.assert_awaited_once_with(local_node_id=2)
+        assert status.mac_address == "a4:81:7a:49:e3:dd"
+        assert status.moca_version == "2.5"
+        assert status.network_peers == peers
+        assert status.model == "MA2500D"
+
+    async def test_get_status_cached(self) -> None:
+        """Test get_status reuses a recent result."""
+        client = GoCoaxClient("192.168.1.1", status_ttl=5)
+        status = MagicMock()
+        with patch.object(
+            client, "_fetch_status", AsyncMock(return_value=status)
+        ) as mock_fetch:
+            assert await client.get_status() is status
+            assert await client.get_status() is status
+            assert mock_fetch.await_count == 1
+
+            with patch(
+                "custom_components.gocoax.pygocoax.client.time.monotonic",
+                return_value=time.monotonic() + 5,
+            ):
+                await client.get_status()
+            assert mock_fetch.await_count == 2
+
+    async def test_get_status_propagates_errors(self) -> None:
+        """Test get_status raises when a required endpoint fails."""
+        client = GoCoaxClient("192.168.1.1")
+        with (
+            patch.object(client, "_request", AsyncMock(return_value={})),
+            patch.object(
+                client,
+                "get_local_info",
+                AsyncMock(side_effect=GoCoaxTimeoutError("timeout")),
+            ),
+            pytest.raises(GoCoaxTimeoutError),
+        ):
+            await client.get_status()
+
+    async def test_optional_endpoint_timeout_propagates(self) -> None:
+        """Test a timed out optional page still fails the poll."""
+        client = GoCoaxClient("192.168.1.1")
+        with (
+            patch.object(
+                client,
+                "_request_html",
+                AsyncMock(side_effect=GoCoaxTimeoutError("timeout")),
+            ),
+            pytest.raises(GoCoaxTimeoutError),
+        ):
+            await client.get_phy_rates()
+
+    async def test_get_status_cancels_pending_on_error(self) -> None:
+        """Test a failed required endpoint cancels the fetches still running."""
+        client = GoCoaxClient("192.168.1.1")
+        cancelled = asyncio.Event()
+
+        async def slow_status_page() -> dict:
+            try:
+                await asyncio.sleep(3600)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return {}
+
+        async def failing_local_info() -> dict:
+            # let every other fetch start before failing
+            await asyncio.sleep(0)
+            raise GoCoaxTimeoutError("timeout")
+
+        with (
+            patch.object(client, "_request", AsyncMock(return_value={})),
+            patch.object(
+                client, "get_frame_info", AsyncMock(return_value=EthernetPackets())
+            ),
+            patch.object(client, "get_status_page", slow_status_page),
+            patch.object(client, "get_local_info", failing_local_info),
+            pytest.raises(GoCoaxTimeoutError),
+        ):
+            await asyncio.wait_for(client.get_status(), timeout=5)
+        assert cancelled.is_set()
+
 
 class TestAdapterStatus:
     """Tests for AdapterStatus model."""
@@ -87,6 +661,96 @@ class TestAdapterStatus:
         assert result["packets"]["tx"]["ok"] == 1000
         assert result["packets"]["rx"]["bad"] == 1
 
+    def test_to_dict_matches_asdict(self) -> None:
+        """Test to_dict covers every field with the same shape as asdict."""
+        status = AdapterStatus(
+            mac_address="a4:81:7a:49:e3:dd",
+            ip_address="192.168.1.1",
+            moca_version="2.5",
+            link_status=True,
+            network_peers=[
+                NetworkPeer(
+                    node_id=2, mac_address="a4:81:7a:00:00:01", moca_version="2.5"
+                )
+            ],
+            phy_rates=[PhyRate("a4:81:7a:49:e3:dd", "a4:81:7a:00:00:01", 2500, 2400)],
+            signal_quality=SignalQuality(snr=35.5),
+        )
+
+        assert status.to_dict() == {**asdict(status), "link_status": "up"}
+
+        # diagnostics output keeps the historical key order
+        result = status.to_dict()
+        assert list(result) == [
+            "mac_address",
+            "ip_address",
+            "moca_version",
+            "link_status",
+            "adapter_name",
+            "firmware_version",
+            "model",
+            "node_id",
+            "nc_node_id",
+            "network_controller",
+            "frequency_band",
+            "lof",
+            "channel_count",
+            "encryption_enabled",
+            "signal_quality",
+            "packets",
+            "network_peers",
+            "phy_rates",
+        ]
+        assert list(result["signal_quality"]) == [
+            "snr",
+            "tx_power",
+            "rx_power",
+            "bit_loading",
+        ]
+        assert list(result["packets"]) == ["tx", "rx"]
+        assert list(result["packets"]["tx"]) == ["ok", "bad", "dropped"]
+        assert list(result["network_peers"][0]) == [
+            "node_id",
+            "mac_address",
+            "moca_version",
+            "tx_phy_rate",
+            "rx_phy_rate",
+        ]
+        assert list(result["phy_rates"][0]) == [
+            "source_mac",
+            "target_mac",
+            "tx_rate",
+            "rx_rate",
+        ]
+
+    def test_to_dict_nested_peers(self) -> None:
+        """Test to_dict converts nested peer entries."""
+        status = AdapterStatus(
+            mac_address="a4:81:7a:49:e3:dd",
+            ip_address="192.168.1.1",
+            moca_version="2.5",
+            link_status=False,
+            network_peers=[
+                NetworkPeer(
+                    node_id=2, mac_address="a4:81:7a:00:00:01", moca_version="2.5"
+                )
+            ],
+        )
+
+        result = status.to_dict()
+
+        assert result["link_status"] == "down"
+        assert result["network_peers"] == [
+            {
+                "node_id": 2,
+                "mac_address": "a4:81:7a:00:00:01",
+                "moca_version": "2.5",
+                "tx_phy_rate": 0,
+                "rx_phy_rate": 0,
+            }
+        ]
+        assert result["signal_quality"]["snr"] is None
+
     def test_peer_count(self) -> None:
         """Test peer count property."""
         status = AdapterStatus(